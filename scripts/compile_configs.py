@@ -0,0 +1,99 @@
+"""
+Compile YAML configs into importable Python modules.
+
+For every `<dir>/*.yaml`, this emits `<dir>/_compiled/<name>.py` defining
+`CONFIG = {...}`. `load_config()` prefers a compiled module over the YAML
+when it is newer, so deployed configs load from cached bytecode instead of
+being re-parsed. YAML remains the authoring format: re-run this script
+after editing a config.
+
+Usage:
+    python scripts/compile_configs.py [config_dir ...]   (default: src/configs)
+"""
+from __future__ import annotations
+
+import math
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+HEADER = "# Generated by scripts/compile_configs.py from {src} -- do not edit.\n\n"
+
+
+def to_literal(obj: Any) -> str:
+    """
+    Render YAML data as Python source that evaluates back to the same value.
+
+    Only plain data is accepted (dict, list, str, int, float, bool, None).
+    Non-finite floats (YAML `.inf` / `.nan`) are written as `float("inf")`
+    etc., since their repr (`inf`, `nan`) is not valid Python source.
+
+    Args:
+        obj (Any):
+            Parsed YAML value.
+
+    Returns:
+        str:
+            Python expression.
+
+    Raises:
+        TypeError:
+            For anything else (e.g. YAML timestamps or sets), which the
+            JSON/YAML load path would not produce either.
+    """
+    if obj is None or isinstance(obj, (bool, int, str)):
+        return repr(obj)
+    if isinstance(obj, float):
+        return repr(obj) if math.isfinite(obj) else f'float("{obj}")'
+    if isinstance(obj, list):
+        return "[" + ", ".join(to_literal(v) for v in obj) + "]"
+    if isinstance(obj, dict):
+        return "{" + ", ".join(f"{to_literal(k)}: {to_literal(v)}" for k, v in obj.items()) + "}"
+    raise TypeError(f"Cannot compile value of type {type(obj).__name__}: {obj!r}")
+
+
+def compile_dir(config_dir: Path) -> list[Path]:
+    """
+    Compile every YAML file in a directory.
+
+    Args:
+        config_dir (Path):
+            Directory containing *.yaml configs.
+
+    Returns:
+        list[Path]:
+            Paths of the written modules.
+
+    Raises:
+        TypeError:
+            If a config contains values that are not plain data (see `to_literal()`).
+    """
+    out_dir = config_dir / "_compiled"
+    out_dir.mkdir(exist_ok=True)
+    written = []
+    for src in sorted(config_dir.glob("*.yaml")):
+        with src.open("rb") as f:
+            raw = yaml.load(f, Loader=Loader) or {}
+        dst = out_dir / (src.stem + ".py")
+        # Atomic: load_config() must never import a half-written module
+        tmp = dst.with_suffix(".py.tmp")
+        tmp.write_text(HEADER.format(src=src.name) + f"CONFIG = {to_literal(raw)}\n", encoding="utf-8")
+        os.replace(tmp, dst)
+        written.append(dst)
+    return written
+
+
+def main(argv: list[str]) -> None:
+    dirs = [Path(a) for a in argv] or [Path("src/configs")]
+    for d in dirs:
+        for dst in compile_dir(d):
+            print(f"Wrote {dst}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,29 +1,49 @@
+from __future__ import annotations
+
 import argparse
+import math
+import re
+import sys
 from pathlib import Path
 
-from src.common.config import load_config
-from src.common.logging import setup_logging
-from src.pipeline.run import run_pipeline
+# Exactly the strings int() / float() accept (after strip), including "1_000",
+# "inf" and "nan", so classifying by regex reads values as the old
+# try-int-then-float fallthrough did.
+_DIGITS = r"\d(?:_?\d)*"
+_INT_RE = re.compile(rf"^[+-]?{_DIGITS}$")
+_FLOAT_RE = re.compile(
+    rf"^[+-]?(?:(?:(?:{_DIGITS})?\.{_DIGITS}|{_DIGITS}\.?)(?:[eE][+-]?{_DIGITS})?|inf(?:inity)?|nan)$",
+    re.IGNORECASE,
+)
 
 
-def build_parser() -> argparse.ArgumentParser:
+def build_base_parser() -> tuple[argparse.ArgumentParser, argparse._SubParsersAction]:
     """
-    Build and return the CLI argument parser for the application.
+    Build the top-level CLI parser without any subcommands attached.
 
-    This defines the command-line interface structure, including:
-      - global arguments (config path)
-      - subcommands (run)
-      - run-specific arguments (video, fps overrides, ODM options)
+    Only global arguments (config path) and an empty subparsers group are
+    created here. Subcommands are attached separately via the builders in
+    `_SUBCOMMANDS`, so `main()` can construct only the one it needs.
 
     Returns:
-        argparse.ArgumentParser:
-            Fully configured argument parser.
+        tuple[argparse.ArgumentParser, argparse._SubParsersAction]:
+            The parser and its (empty) subparsers group.
     """
     p = argparse.ArgumentParser(prog="Photogrammetry-ODM", description="Drone video -> frames -> ODM 3D model pipeline")
     p.add_argument("--config", type=str, default="configs/default.yaml", help="Path to YAML config")
 
     sub = p.add_subparsers(dest="cmd", required=True)
+    return p, sub
+
+
+def _add_run_subparser(sub) -> None:
+    """
+    Attach the `run` subcommand and its arguments.
 
+    Args:
+        sub (argparse._SubParsersAction):
+            Subparsers group returned by `build_base_parser()`.
+    """
     r = sub.add_parser("run", help="Run the full pipeline")
     r.add_argument("--video", type=str, required=True, help="Path to input video (inside container)")
     r.add_argument("--run-id", type=str, default="", help="Optional run id; default auto")
@@ -31,8 +51,91 @@ def build_parser() -> argparse.ArgumentParser:
     r.add_argument("--max-frames", type=int, default=None, help="Override max frames (0=unlimited)")
     r.add_argument("--start-seconds", type=float, default=None, help="Override video start offset")
     r.add_argument("--duration-seconds", type=float, default=None, help="Override extraction duration (0=full)")
+    r.add_argument(
+        "--segment", action="append", type=parse_segment, default=[], metavar="START:DURATION",
+        help="Extract only this time range in seconds (repeatable; one ffmpeg pass; DURATION 0=to end)",
+    )
     r.add_argument("--odm-opt", action="append", default=[], help="Extra ODM options as key=value (repeatable)")
     r.add_argument("--no-copy-processed", action="store_true", help="Do not copy summary outputs to data/processed")
+    r.add_argument("--shard-hosts", action="store_true", help="Split images across all NodeODM hosts as independent tasks (preview runs)")
+    r.add_argument("--daemon", action="store_true", help="Relay the run to a running pipeline daemon (falls back to in-process)")
+
+
+def _add_daemon_subparser(sub) -> None:
+    """
+    Attach the `daemon` subcommand (start/stop/status).
+
+    Args:
+        sub (argparse._SubParsersAction):
+            Subparsers group returned by `build_base_parser()`.
+    """
+    d = sub.add_parser("daemon", help="Manage the long-lived pipeline daemon")
+    d.add_argument("action", choices=["start", "stop", "status"], help="start (foreground), stop, or status")
+
+
+# Subcommand name -> builder that attaches it to the subparsers group.
+_SUBCOMMANDS = {
+    "run": _add_run_subparser,
+    "daemon": _add_daemon_subparser,
+}
+
+# Top-level options that consume the following token as their value.
+_VALUE_OPTIONS = frozenset({"--config"})
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """
+    Find the requested subcommand in argv without fully parsing it.
+
+    The first positional token (skipping the values of top-level options
+    such as `--config PATH`) is the subcommand. Returns None if it is not
+    a known subcommand, or if top-level help was requested before it (so
+    the full parser reports the error or lists every subcommand).
+
+    Args:
+        argv (list[str]):
+            Command-line arguments (without the program name).
+
+    Returns:
+        str | None:
+            Subcommand name, or None if all subparsers should be built.
+    """
+    it = iter(argv)
+    for tok in it:
+        if tok in ("-h", "--help"):
+            return None
+        if tok in _VALUE_OPTIONS:
+            next(it, None)
+        elif not tok.startswith("-"):
+            return tok if tok in _SUBCOMMANDS else None
+    return None
+
+
+def build_parser(argv: list[str] | None = None) -> argparse.ArgumentParser:
+    """
+    Build and return the CLI argument parser for the application.
+
+    This defines the command-line interface structure, including:
+      - global arguments (config path)
+      - subcommands (run)
+      - run-specific arguments (video, fps overrides, ODM options)
+
+    When `argv` is given, only the subcommand requested in it is built
+    (see `_sniff_subcommand()`); otherwise all subcommands are attached.
+
+    Args:
+        argv (list[str] | None):
+            Optional command-line arguments used to pick the subcommand.
+
+    Returns:
+        argparse.ArgumentParser:
+            Fully configured argument parser.
+    """
+    p, sub = build_base_parser()
+    name = _sniff_subcommand(argv) if argv is not None else None
+    builders = [_SUBCOMMANDS[name]] if name else list(_SUBCOMMANDS.values())
+    for add in builders:
+        add(sub)
     return p
 
 
@@ -45,8 +148,8 @@ def parse_kv_list(kv_list):
 
     Supported coercions:
       - "true"/"false" -> bool
-      - integers -> int
-      - floats -> float
+      - integers -> int (Python literal rules, e.g. "1_000" -> 1000)
+      - floats -> float (including "inf" / "nan")
       - otherwise remains string
 
     Example:
@@ -65,50 +168,88 @@ def parse_kv_list(kv_list):
         if "=" not in item:
             raise ValueError(f"Invalid --odm-opt '{item}'. Must be key=value")
         k, v = item.split("=", 1)
-        # basic type coercion
-        vl = v.strip().lower()
+        k = k.strip()
+        # basic type coercion (regex classification, no exceptions)
+        vs = v.strip()
+        vl = vs.lower()
         if vl in ("true", "false"):
-            out[k.strip()] = (vl == "true")
+            out[k] = (vl == "true")
+        elif _INT_RE.match(vs):
+            out[k] = int(vs)
+        elif _FLOAT_RE.match(vs):
+            out[k] = float(vs)
         else:
-            # try int/float
-            try:
-                out[k.strip()] = int(v)
-            except ValueError:
-                try:
-                    out[k.strip()] = float(v)
-                except ValueError:
-                    out[k.strip()] = v
+            out[k] = v
     return out
 
 
-def main():
+def parse_segment(text: str) -> tuple[float, float]:
     """
-    Main entrypoint for the CLI application.
+    Parse a `--segment START:DURATION` value.
 
-    Workflow:
-      1. Parse CLI arguments
-      2. Validate config file exists
-      3. Load configuration from YAML into AppConfig
-      4. Setup global logging
-      5. Execute requested command (currently only "run")
+    Args:
+        text (str):
+            Value such as "12.5:30" (seconds).
 
-    Supported command:
-      - run: executes the full pipeline from video -> frames -> ODM outputs
+    Returns:
+        tuple[float, float]:
+            (start_seconds, duration_seconds)
+
+    Raises:
+        argparse.ArgumentTypeError:
+            If the value is not two finite, non-negative numbers separated by ":".
     """
-    parser = build_parser()
-    args = parser.parse_args()
+    start_s, sep, dur_s = text.partition(":")
+    if not sep or not _FLOAT_RE.match(start_s.strip()) or not _FLOAT_RE.match(dur_s.strip()):
+        raise argparse.ArgumentTypeError(f"expected START:DURATION in seconds, got {text!r}")
+    start, dur = float(start_s), float(dur_s)
+    if not (math.isfinite(start) and math.isfinite(dur)) or start < 0 or dur < 0:
+        raise argparse.ArgumentTypeError(f"segment values must be finite and non-negative, got {text!r}")
+    return start, dur
 
+
+def execute(args: argparse.Namespace) -> None:
+    """
+    Execute a parsed pipeline command in the current process.
+
+    This is shared by `main()` and the daemon (`src.daemon`), which
+    receives the parsed arguments from a CLI client over its socket.
+
+    Workflow:
+      1. Validate config file exists
+      2. Load configuration from YAML into AppConfig
+      3. Setup global logging
+      4. Execute requested command (currently only "run")
+
+    Args:
+        args (argparse.Namespace):
+            Parsed CLI arguments.
+
+    Returns:
+        None
+
+    Raises:
+        FileNotFoundError:
+            If the config file does not exist.
+    """
     config_path = Path(args.config)
     if not config_path.exists():
         raise FileNotFoundError(
             f"Config not found: {config_path}. "
             f"Create it (recommended) or run with --config <path>."
         )
+
+    # Heavy imports are deferred so `--help` and argument errors return fast.
+    from src.common.config import load_config
+    from src.common.logging import setup_logging
+
     cfg = load_config(config_path)
 
     setup_logging(cfg.runtime.log_level)
 
     if args.cmd == "run":
+        from src.pipeline.run import run_pipeline
+
         extra_odm = parse_kv_list(args.odm_opt)
         run_pipeline(
             cfg=cfg,
@@ -120,8 +261,42 @@ def main():
             duration_seconds=args.duration_seconds,
             odm_extra_options=extra_odm,
             copy_processed=not args.no_copy_processed,
+            shard_hosts=args.shard_hosts,
+            segments=args.segment,
         )
 
 
+def main():
+    """
+    Main entrypoint for the CLI application.
+
+    Workflow:
+      1. Parse CLI arguments
+      2. For "run --daemon", relay to a running daemon if there is one (and idle)
+      3. Otherwise execute the command in-process (see `execute()`)
+
+    Supported commands:
+      - run: executes the full pipeline from video -> frames -> ODM outputs
+      - daemon: start/stop/status of the long-lived pipeline daemon
+    """
+    argv = sys.argv[1:]
+    parser = build_parser(argv)
+    args = parser.parse_args(argv)
+
+    if args.cmd == "daemon":
+        from src.daemon import daemon_main
+
+        daemon_main(args.action)
+        return
+
+    if args.cmd == "run" and args.daemon:
+        from src.daemon import relay
+
+        if relay(args.cmd, vars(args)):
+            return
+
+    execute(args)
+
+
 if __name__ == "__main__":
     main()
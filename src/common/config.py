@@ -1,13 +1,24 @@
 from __future__ import annotations
 
+import functools
+import importlib.util
+import json
+import logging
+import os
+import types
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 
 import yaml
 
+log = logging.getLogger(__name__)
 
-@dataclass(frozen=True)
+# Prefer the libyaml-backed loader when available; fall back to pure Python.
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@dataclass(frozen=True, slots=True)
 class RuntimeConfig:
     """
     Holds runtime-related configuration parameters.
@@ -23,13 +34,25 @@ class RuntimeConfig:
         log_level (str):
             Logging level to be used throughout the pipeline.
             Typical values: "DEBUG", "INFO", "WARNING", "ERROR".
+
+        run_id_full_hash (bool):
+            If True, generated run ids hash the entire input video
+            (BLAKE3 when installed, otherwise SHA1).
+            If False (default), only a sampled fingerprint is hashed.
+
+        run_id_from_metadata (bool):
+            If True, generated run ids hash the video's ffprobe metadata
+            (size, duration, bit rate, creation_time) instead of its bytes,
+            falling back to the setting above when ffprobe is unavailable.
     """
     runs_dir: Path
     data_dir: Path
     log_level: str
+    run_id_full_hash: bool = False
+    run_id_from_metadata: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ODMConfig:
     """
     Holds OpenDroneMap / NodeODM related configuration.
@@ -57,7 +80,7 @@ class ODMConfig:
     poll_seconds: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VideoConfig:
     """
     Holds video preprocessing configuration.
@@ -83,7 +106,7 @@ class VideoConfig:
     duration_seconds: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProjectConfig:
     """
     Holds basic project metadata.
@@ -96,7 +119,7 @@ class ProjectConfig:
     name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """
     Root application configuration object.
@@ -117,8 +140,8 @@ class AppConfig:
         video (VideoConfig):
             Video preprocessing and extraction parameters.
 
-        odm_options (Dict[str, Any]):
-            Additional raw ODM processing options.
+        odm_options (Mapping[str, Any]):
+            Additional raw ODM processing options (read-only mapping).
             This is passed directly to NodeODM (or used by the pipeline)
             and may include options like:
                 - dsm
@@ -133,7 +156,30 @@ class AppConfig:
     runtime: RuntimeConfig
     odm: ODMConfig
     video: VideoConfig
-    odm_options: Dict[str, Any]
+    odm_options: Mapping[str, Any]
+
+
+# Pre-split dotted keys read by load_config(), so parsing skips str.split().
+_SCHEMA: Dict[str, tuple[str, ...]] = {
+    key: tuple(key.split("."))
+    for key in (
+        "project.name",
+        "runtime.runs_dir",
+        "runtime.data_dir",
+        "runtime.log_level",
+        "runtime.run_id_full_hash",
+        "runtime.run_id_from_metadata",
+        "odm.host_env",
+        "odm.host_default",
+        "odm.parallel_uploads",
+        "odm.poll_seconds",
+        "video.fps",
+        "video.max_frames",
+        "video.start_seconds",
+        "video.duration_seconds",
+        "odm_options",
+    )
+}
 
 
 def _get(d: Dict[str, Any], path: str, default=None):
@@ -141,7 +187,8 @@ def _get(d: Dict[str, Any], path: str, default=None):
     Helper function for safely retrieving nested dictionary values.
 
     This function allows accessing YAML-loaded dictionaries using
-    dot-separated keys.
+    dot-separated keys. Known keys use the pre-split parts in `_SCHEMA`;
+    any other key is split on demand.
 
     Example:
         raw = {"runtime": {"runs_dir": "runs"}}
@@ -163,14 +210,139 @@ def _get(d: Dict[str, Any], path: str, default=None):
             The value at the requested path if it exists,
             otherwise the provided default.
     """
+    parts = _SCHEMA.get(path) or path.split(".")
     cur = d
-    for part in path.split("."):
+    for part in parts:
         if not isinstance(cur, dict) or part not in cur:
             return default
         cur = cur[part]
     return cur
 
 
+def _compiled_path(path: Path) -> Path:
+    """
+    Return where `scripts/compile_configs.py` emits the compiled form of a config.
+
+    Example:
+        src/configs/default.yaml -> src/configs/_compiled/default.py
+
+    Args:
+        path (Path):
+            Path to the YAML configuration file.
+
+    Returns:
+        Path:
+            Path of the compiled Python module (may not exist).
+    """
+    return path.parent / "_compiled" / (path.stem + ".py")
+
+
+def _load_compiled(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Load the `CONFIG` dict from a compiled config module, if it is current.
+
+    Importing a module is bytecode-cached by CPython (`__pycache__`), so
+    deployed configs skip both YAML and JSON parsing entirely. The compiled
+    module is ignored when it is older than the YAML source, and any
+    error while importing it (e.g. a half-written or hand-edited file)
+    falls back to the YAML/cache path instead of breaking every load.
+
+    Args:
+        path (Path):
+            Path to the YAML configuration file.
+
+    Returns:
+        Optional[Dict[str, Any]]:
+            Raw configuration dictionary, or None if no usable compiled module exists.
+    """
+    compiled = _compiled_path(path)
+    try:
+        if compiled.stat().st_mtime < path.stat().st_mtime:
+            return None
+    except OSError:
+        return None
+
+    spec = importlib.util.spec_from_file_location(f"_compiled_config_{path.stem}", compiled)
+    if spec is None or spec.loader is None:
+        return None
+    mod = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(mod)
+    except Exception as e:
+        log.warning("Ignoring unusable compiled config %s: %s", compiled, e)
+        return None
+    config = getattr(mod, "CONFIG", None)
+    return config if isinstance(config, dict) else None
+
+
+def _read_raw(path: Path) -> Dict[str, Any]:
+    """
+    Read the raw YAML config dictionary, using a JSON sidecar cache.
+
+    A current compiled module (see `_load_compiled()`) takes precedence
+    over everything else.
+
+    The parsed YAML is stored next to the config file as
+    `<name>.yaml.cache.json`, together with the YAML's `st_mtime_ns` and
+    `st_size`. On subsequent calls the cache is used only if both match
+    exactly, which skips YAML parsing entirely for the common "config
+    unchanged" case. Configs that don't survive a JSON round trip
+    unchanged (e.g. integer keys, dates) are never cached. Files that are
+    valid JSON are parsed with `json` directly and are not cached.
+
+    Cache writes are atomic (temp file + `os.replace`) and failures are
+    ignored, so read-only installs simply fall back to parsing YAML.
+
+    Args:
+        path (Path):
+            Path to the YAML configuration file.
+
+    Returns:
+        Dict[str, Any]:
+            Raw configuration dictionary (may be empty).
+    """
+    compiled = _load_compiled(path)
+    if compiled is not None:
+        return compiled
+
+    st = path.stat()
+    cache = path.with_suffix(path.suffix + ".cache.json")
+    try:
+        cached = json.loads(cache.read_bytes())
+        if cached["mtime_ns"] == st.st_mtime_ns and cached["size"] == st.st_size:
+            return cached["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    data = path.read_bytes()
+
+    # YAML is a JSON superset: JSON-compatible configs skip PyYAML entirely,
+    # and real YAML fails fast on the first non-JSON token.
+    try:
+        return json.loads(data) or {}
+    except ValueError:
+        pass
+
+    # Bytes input lets libyaml decode directly (no intermediate str)
+    raw = yaml.load(data, Loader=Loader) or {}
+
+    try:
+        encoded = json.dumps(raw)
+        # e.g. {1: "a"} would come back as {"1": "a"}
+        if json.loads(encoded) == raw:
+            tmp = cache.with_suffix(cache.suffix + ".tmp")
+            tmp.write_text(
+                json.dumps({"mtime_ns": st.st_mtime_ns, "size": st.st_size, "data": raw}),
+                encoding="utf-8",
+            )
+            os.replace(tmp, cache)
+    except (OSError, TypeError, ValueError):
+        # Read-only location or non-JSON values (e.g. YAML dates): no cache.
+        pass
+
+    return raw
+
+
 def load_config(path: Path) -> AppConfig:
     """
     Load application configuration from a YAML file and convert it
@@ -184,6 +356,9 @@ def load_config(path: Path) -> AppConfig:
         - AppConfig
 
     Any missing values in the YAML will fallback to defaults.
+    The parsed YAML is cached in a JSON sidecar (see `_read_raw()`), and
+    the resulting AppConfig is memoized per (path, mtime, size), so repeated
+    calls in one process return the same immutable object.
 
     Expected YAML structure example:
 
@@ -194,6 +369,8 @@ def load_config(path: Path) -> AppConfig:
           runs_dir: "runs"
           data_dir: "data"
           log_level: "INFO"
+          run_id_full_hash: false
+          run_id_from_metadata: false
 
         odm:
           host_env: "ODM_HOST"
@@ -221,7 +398,34 @@ def load_config(path: Path) -> AppConfig:
         AppConfig:
             Fully constructed structured configuration object.
     """
-    raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+    st = path.stat()
+    return _load_config_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_config_cached(path_str: str, mtime_ns: int, size: int) -> AppConfig:
+    """
+    Build the AppConfig for `load_config()`.
+
+    The (mtime_ns, size) arguments only serve as cache key, so edits to
+    the YAML file produce a fresh entry.
+
+    Args:
+        path_str (str):
+            Path to the YAML configuration file.
+
+        mtime_ns (int):
+            File modification time in nanoseconds.
+
+        size (int):
+            File size in bytes.
+
+    Returns:
+        AppConfig:
+            Fully constructed structured configuration object.
+    """
+    path = Path(path_str)
+    raw = _read_raw(path)
 
     # Project metadata
     project = ProjectConfig(name=str(_get(raw, "project.name", "Photogrammetry-ODM")))
@@ -230,7 +434,15 @@ def load_config(path: Path) -> AppConfig:
     runs_dir = Path(str(_get(raw, "runtime.runs_dir", "runs")))
     data_dir = Path(str(_get(raw, "runtime.data_dir", "data")))
     log_level = str(_get(raw, "runtime.log_level", "INFO"))
-    runtime = RuntimeConfig(runs_dir=runs_dir, data_dir=data_dir, log_level=log_level)
+    run_id_full_hash = bool(_get(raw, "runtime.run_id_full_hash", False))
+    run_id_from_metadata = bool(_get(raw, "runtime.run_id_from_metadata", False))
+    runtime = RuntimeConfig(
+        runs_dir=runs_dir,
+        data_dir=data_dir,
+        log_level=log_level,
+        run_id_full_hash=run_id_full_hash,
+        run_id_from_metadata=run_id_from_metadata,
+    )
 
     # NodeODM settings
     odm = ODMConfig(
@@ -249,6 +461,9 @@ def load_config(path: Path) -> AppConfig:
     )
 
     # Raw ODM processing options (kept flexible)
-    odm_options = dict(_get(raw, "odm_options", {}) or {})
+    # Read-only view over the freshly parsed dict (no copy needed), so
+    # cached AppConfig instances can't be mutated by callers
+    raw_opts = _get(raw, "odm_options", None)
+    odm_options = types.MappingProxyType(raw_opts if isinstance(raw_opts, dict) else {})
 
     return AppConfig(project=project, runtime=runtime, odm=odm, video=video, odm_options=odm_options)
@@ -6,13 +6,17 @@ def setup_logging(level: str = "INFO") -> None:
     """
     Configure global application logging settings.
 
-    This function initializes Python's built-in logging system using
-    `logging.basicConfig()`. It sets:
+    This function installs a single stdout handler with a pre-built
+    formatter directly on the root logger (no `logging.basicConfig()`).
+    It sets:
 
     - The logging level (INFO by default)
     - A standardized log message format
     - A stream handler that outputs logs to stdout
 
+    It also turns off thread/process info collection and caller lookup
+    (`findCaller`) on every record, since the format does not use them.
+
     This is typically called once at the beginning of the application
     to ensure all modules use consistent logging behavior.
 
@@ -31,8 +35,16 @@ def setup_logging(level: str = "INFO") -> None:
     Returns:
         None
     """
-    logging.basicConfig(
-        level=getattr(logging, level.upper(), logging.INFO),
-        format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-        handlers=[logging.StreamHandler(sys.stdout)],
-    )
+    fmt = logging.Formatter("%(asctime)s | %(levelname)s | %(name)s | %(message)s", validate=False)
+    h = logging.StreamHandler(sys.stdout)
+    h.setFormatter(fmt)
+
+    root = logging.getLogger()
+    root.handlers[:] = [h]
+    root.setLevel(getattr(logging, level.upper(), logging.INFO))
+
+    # Skip per-record work the format string never uses
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunPaths:
     """
     Container object holding all important filesystem paths
@@ -42,7 +43,7 @@ class RunPaths:
     processed_dir: Path
 
 
-def build_run_paths(runs_dir: Path, data_dir: Path, run_id: str) -> RunPaths:
+def build_run_paths(runs_dir: Path, data_dir: Path, run_id: str, create: bool = False) -> RunPaths:
     """
     Construct all filesystem paths required for a pipeline run.
 
@@ -51,8 +52,12 @@ def build_run_paths(runs_dir: Path, data_dir: Path, run_id: str) -> RunPaths:
         - data_dir (where datasets/intermediate files live)
         - run_id (unique identifier for the current run)
 
-    The function does not create directories on disk; it only builds
-    and returns the expected Path objects.
+    By default the function does not create directories on disk; it only
+    builds and returns the expected Path objects. With `create=True` the
+    run, logs, frames and ODM output directories are created in one pass
+    (see `_create_dirs()`). `processed_dir` is left to the code that
+    copies summary outputs into it, so runs without copying (e.g.
+    `--no-copy-processed`) don't leave empty `processed/` trees behind.
 
     Directory layout produced:
 
@@ -80,6 +85,9 @@ def build_run_paths(runs_dir: Path, data_dir: Path, run_id: str) -> RunPaths:
         run_id (str):
             Unique run identifier (timestamp, UUID, experiment name, etc.).
 
+        create (bool):
+            If True, create the run directories on disk (all but `processed_dir`).
+
     Returns:
         RunPaths:
             A structured RunPaths object containing all important
@@ -90,6 +98,8 @@ def build_run_paths(runs_dir: Path, data_dir: Path, run_id: str) -> RunPaths:
     frames_dir = data_dir / "interim" / "frames" / run_id
     odm_out_dir = run_dir / "odm"
     processed_dir = data_dir / "processed" / "odm_results" / run_id
+    if create:
+        _create_dirs((run_dir, logs_dir, frames_dir, odm_out_dir))
     return RunPaths(
         run_dir=run_dir,
         logs_dir=logs_dir,
@@ -97,3 +107,28 @@ def build_run_paths(runs_dir: Path, data_dir: Path, run_id: str) -> RunPaths:
         odm_out_dir=odm_out_dir,
         processed_dir=processed_dir,
     )
+
+
+def _create_dirs(leaves: tuple[Path, ...]) -> None:
+    """
+    Create a set of directories, sharing parent creation across siblings.
+
+    Unique parents (that are not themselves in `leaves`) are created once
+    with `os.makedirs`, shallowest first; the leaves are then created
+    with a single `os.mkdir` each, instead of one recursive walk per leaf.
+
+    Args:
+        leaves (tuple[Path, ...]):
+            Directories to create.
+
+    Returns:
+        None
+    """
+    parents = {d.parent for d in leaves} - set(leaves)
+    for p in sorted(parents, key=lambda p: len(p.parts)):
+        os.makedirs(p, exist_ok=True)
+    for d in sorted(leaves, key=lambda p: len(p.parts)):
+        try:
+            os.mkdir(d)
+        except FileExistsError:
+            pass
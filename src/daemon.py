@@ -0,0 +1,468 @@
+from __future__ import annotations
+
+import argparse
+import builtins
+import contextlib
+import json
+import logging
+import os
+import socket
+import stat
+import sys
+import tempfile
+import threading
+import traceback
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+log = logging.getLogger(__name__)
+
+SOCKET_NAME = "photogrammetry-odm.sock"
+
+
+def socket_path() -> Path:
+    """
+    Return the Unix socket path used by the pipeline daemon.
+
+    The socket lives in `$XDG_RUNTIME_DIR` when set (already private to
+    the user), otherwise in a per-user `photogrammetry-odm-<uid>`
+    directory under the system temp directory (e.g. /tmp inside the
+    pipeline container), so other users cannot squat the socket.
+
+    Returns:
+        Path:
+            Path of the daemon socket.
+    """
+    base = os.environ.get("XDG_RUNTIME_DIR")
+    if base:
+        return Path(base) / SOCKET_NAME
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return Path(tempfile.gettempdir()) / f"photogrammetry-odm-{uid}" / SOCKET_NAME
+
+
+def _socket_dir_is_private(path: Path) -> bool:
+    """
+    Check that the socket's directory is owned by us and not writable by others.
+
+    Args:
+        path (Path):
+            Socket path (see `socket_path()`).
+
+    Returns:
+        bool:
+            True if the directory exists, belongs to the current user,
+            and grants no group/other write access.
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    try:
+        st = path.parent.stat()
+    except FileNotFoundError:
+        return False
+    return st.st_uid == os.getuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def _connect(timeout: Optional[float]) -> Optional[socket.socket]:
+    """
+    Connect to the daemon socket.
+
+    Args:
+        timeout (Optional[float]):
+            Socket timeout in seconds (None waits indefinitely).
+
+    Returns:
+        Optional[socket.socket]:
+            Connected socket, or None if no daemon is listening
+            (or the socket directory is not private to this user).
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    path = socket_path()
+    if not _socket_dir_is_private(path):
+        return None
+
+    s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    s.settimeout(timeout)
+    try:
+        s.connect(str(path))
+    except (FileNotFoundError, ConnectionRefusedError):
+        s.close()
+        return None
+    return s
+
+
+def _send(msg: Dict[str, Any], timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """
+    Send one JSON request to the daemon and return its JSON reply.
+
+    The protocol is newline-terminated JSON objects, one request per
+    connection. Before its final reply, the daemon may send any number of
+    `{"stream": "stdout"|"stderr", "data": ...}` messages carrying the
+    run's console output; they are written to this process's stdout/stderr.
+
+    Args:
+        msg (Dict[str, Any]):
+            Request message, e.g. {"cmd": "status"}.
+
+        timeout (Optional[float]):
+            Socket timeout in seconds. None waits indefinitely
+            (a relayed run lasts as long as the pipeline).
+
+    Returns:
+        Optional[Dict[str, Any]]:
+            Final reply message, or None if no daemon is listening.
+
+    Raises:
+        RuntimeError:
+            If the daemon accepted the request but closed the connection
+            without replying (e.g. it crashed mid-run).
+    """
+    s = _connect(timeout)
+    if s is None:
+        return None
+
+    try:
+        s.sendall(json.dumps(msg).encode("utf-8") + b"\n")
+        with s.makefile("rb") as f:
+            for line in f:
+                reply = json.loads(line)
+                stream = reply.get("stream")
+                if stream is None:
+                    return reply
+                out = sys.stderr if stream == "stderr" else sys.stdout
+                out.write(reply.get("data", ""))
+                out.flush()
+    finally:
+        s.close()
+
+    raise RuntimeError("Daemon closed the connection without replying")
+
+
+def relay(cmd: str, args: Dict[str, Any]) -> bool:
+    """
+    Relay a CLI command to a running daemon, if there is one.
+
+    The client's working directory and environment are sent along, so
+    relative paths (video, config, runs/data dirs) and overrides such as
+    `ODM_HOST` resolve exactly as they would in-process. The run's log,
+    progress bar and ffmpeg output are streamed back to this terminal.
+
+    Args:
+        cmd (str):
+            CLI subcommand name (currently only "run").
+
+        args (Dict[str, Any]):
+            Parsed CLI arguments (`vars(argparse.Namespace)`).
+
+    Returns:
+        bool:
+            True if the daemon executed the command, False if no daemon
+            is running or it is busy with another run (caller should run
+            in-process; the reason is printed to stderr).
+
+    Raises:
+        Exception:
+            If the daemon reports that the command failed, the same
+            built-in exception type is raised here (RuntimeError for
+            non built-in types), with the daemon's message.
+    """
+    reply = _send({
+        "cmd": cmd,
+        "args": args,
+        "cwd": os.getcwd(),
+        "env": dict(os.environ),
+        "tty": sys.stderr.isatty(),
+    })
+    if reply is None:
+        print("No pipeline daemon running; running in-process.", file=sys.stderr)
+        return False
+    if reply.get("busy"):
+        print("Pipeline daemon is busy with another run; running in-process.", file=sys.stderr)
+        return False
+    if not reply.get("ok"):
+        exc_type = getattr(builtins, reply.get("type") or "", None)
+        if not (isinstance(exc_type, type) and issubclass(exc_type, Exception)):
+            exc_type = RuntimeError
+        raise exc_type(reply.get("error"))
+    return True
+
+
+class _SocketStream:
+    """
+    Minimal text stream that forwards writes to a relay client.
+
+    Installed as sys.stdout/sys.stderr while a relayed run executes, so
+    logging handlers, tqdm bars and run_cmd output reach the client.
+    """
+
+    def __init__(self, conn: socket.socket, name: str, tty: bool, lock: threading.Lock):
+        self._conn = conn
+        self._name = name
+        self._tty = tty
+        self._lock = lock
+        self.closed = False
+
+    def write(self, data: str) -> int:
+        if data and not self.closed:
+            msg = json.dumps({"stream": self._name, "data": data}).encode("utf-8") + b"\n"
+            with self._lock:
+                try:
+                    self._conn.sendall(msg)
+                except OSError:
+                    # Client went away; keep the run going silently
+                    self.closed = True
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
+        return self._tty
+
+
+@contextlib.contextmanager
+def _client_context(conn: socket.socket, msg: Dict[str, Any]) -> Iterator[None]:
+    """
+    Run the enclosed block as if it were the client process.
+
+    Temporarily switches to the client's cwd and environment, points
+    sys.stdout/sys.stderr at the client connection, and restores the
+    daemon's logging handlers afterwards (`setup_logging()` replaces them).
+
+    Args:
+        conn (socket.socket):
+            Client connection.
+
+        msg (Dict[str, Any]):
+            Run request with "cwd", "env" and "tty".
+    """
+    lock = threading.Lock()
+    tty = bool(msg.get("tty"))
+    saved_cwd = os.getcwd()
+    saved_env = dict(os.environ)
+    saved_streams = sys.stdout, sys.stderr
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+
+    os.chdir(msg["cwd"])
+    os.environ.clear()
+    os.environ.update(msg.get("env") or saved_env)
+    sys.stdout = _SocketStream(conn, "stdout", tty, lock)
+    sys.stderr = _SocketStream(conn, "stderr", tty, lock)
+    try:
+        yield
+    finally:
+        sys.stdout, sys.stderr = saved_streams
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+        os.environ.clear()
+        os.environ.update(saved_env)
+        os.chdir(saved_cwd)
+
+
+def _read_request(conn: socket.socket) -> Optional[Dict[str, Any]]:
+    """
+    Read one JSON request line from a client connection.
+
+    Args:
+        conn (socket.socket):
+            Accepted client connection.
+
+    Returns:
+        Optional[Dict[str, Any]]:
+            Decoded request, or None if the client sent nothing usable
+            within the timeout (an error reply has then been sent).
+    """
+    # Never let a silent client stall the accept loop
+    conn.settimeout(5.0)
+    try:
+        with conn.makefile("rb") as f:
+            line = f.readline()
+        msg = json.loads(line)
+        if not isinstance(msg, dict):
+            raise ValueError("request must be a JSON object")
+    except (OSError, ValueError) as e:
+        _reply(conn, {"ok": False, "type": type(e).__name__, "error": f"Bad request: {e}"})
+        return None
+    conn.settimeout(None)
+    return msg
+
+
+def _reply(conn: socket.socket, reply: Dict[str, Any]) -> None:
+    """
+    Send the final JSON reply of a request, ignoring clients that went away.
+
+    Args:
+        conn (socket.socket):
+            Client connection.
+
+        reply (Dict[str, Any]):
+            Reply message.
+    """
+    try:
+        conn.sendall(json.dumps(reply).encode("utf-8") + b"\n")
+    except OSError:
+        # Client went away; nothing to report back to
+        pass
+
+
+def _handle_run(conn: socket.socket, msg: Dict[str, Any]) -> None:
+    """
+    Execute a relayed run and send its final reply (runner thread).
+
+    Any failure, including one raised while switching to the client's
+    context (e.g. a missing cwd), has its traceback written to the
+    client's stderr and is reported as the final error reply.
+
+    Args:
+        conn (socket.socket):
+            Client connection; closed when done.
+
+        msg (Dict[str, Any]):
+            {"cmd": "run", "args": {...}, "cwd": ..., "env": {...}, "tty": ...}
+    """
+    # Deferred: the daemon shares the CLI's command implementation
+    from src.cli import execute
+
+    with conn:
+        try:
+            with _client_context(conn, msg):
+                try:
+                    execute(argparse.Namespace(**msg["args"]))
+                except Exception:
+                    # sys.stderr is the client stream here
+                    traceback.print_exc()
+                    raise
+        except Exception as e:
+            log.warning("Relayed run from %s failed: %s: %s", msg.get("cwd"), type(e).__name__, e)
+            reply = {"ok": False, "type": type(e).__name__, "error": str(e)}
+        else:
+            reply = {"ok": True}
+        _reply(conn, reply)
+
+
+def serve() -> None:
+    """
+    Run the pipeline daemon in the foreground until a "stop" request.
+
+    Keeping one long-lived process amortizes interpreter startup and the
+    yaml/pipeline imports across CLI invocations; configs stay memoized
+    by `load_config()` between runs.
+
+    Supported requests:
+      - {"cmd": "status"}                       -> {"ok": true, "pid": ..., "busy": ...}
+      - {"cmd": "stop"}                         -> {"ok": true, "busy": ...}
+      - {"cmd": "run", "args": {...}, "cwd": ..., "env": {...}}
+                                                -> streams output, then {"ok": ...}
+
+    Control requests (status/stop) are answered directly by the accept
+    loop, so they never wait behind a run. Runs execute one at a time on
+    a runner thread, because each one switches the process to the
+    client's working directory and environment; a run request arriving
+    while another is active gets {"ok": false, "busy": true} and the
+    client runs in-process instead. "stop" lets an active run finish.
+
+    Returns:
+        None
+
+    Raises:
+        RuntimeError:
+            If another daemon is already listening on the socket, the
+            socket directory is not private to this user, or Unix sockets
+            are unavailable on this platform.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise RuntimeError("Unix domain sockets are not supported on this platform")
+
+    path = socket_path()
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if not _socket_dir_is_private(path):
+        raise RuntimeError(f"Refusing to serve: {path.parent} is not private to this user")
+    try:
+        running = _send({"cmd": "status"}, timeout=2.0) is not None
+    except OSError:
+        # Something accepted the connection but did not answer in time
+        running = True
+    if running:
+        raise RuntimeError(f"Daemon already running on {path}")
+    # Remove a stale socket left by a crashed daemon
+    path.unlink(missing_ok=True)
+
+    srv = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    runner: Optional[threading.Thread] = None
+    try:
+        srv.bind(str(path))
+        os.chmod(path, 0o600)
+        srv.listen()
+        log.info("Daemon listening on %s (pid=%d)", path, os.getpid())
+
+        while True:
+            conn, _ = srv.accept()
+            msg = _read_request(conn)
+            if msg is None:
+                conn.close()
+                continue
+
+            busy = runner is not None and runner.is_alive()
+            cmd = msg.get("cmd")
+            if cmd == "run" and not busy:
+                log.info("Relayed run from %s", msg.get("cwd"))
+                runner = threading.Thread(target=_handle_run, args=(conn, msg), name="daemon-run")
+                runner.start()
+                continue
+
+            with conn:
+                if cmd == "run":
+                    _reply(conn, {"ok": False, "busy": True, "error": "Daemon is busy with another run"})
+                elif cmd == "status":
+                    _reply(conn, {"ok": True, "pid": os.getpid(), "busy": busy})
+                elif cmd == "stop":
+                    _reply(conn, {"ok": True, "busy": busy})
+                    break
+                else:
+                    _reply(conn, {"ok": False, "error": f"Unknown command: {cmd!r}"})
+    finally:
+        srv.close()
+        path.unlink(missing_ok=True)
+        if runner is not None:
+            # "stop" lets the active run finish
+            runner.join()
+        log.info("Daemon stopped.")
+
+
+def daemon_main(action: str) -> None:
+    """
+    Entry point for `daemon start|stop|status`.
+
+    Args:
+        action (str):
+            One of "start" (serve in the foreground), "stop", or "status".
+
+    Returns:
+        None
+    """
+    if action == "start":
+        from src.common.logging import setup_logging
+
+        setup_logging("INFO")
+        serve()
+        return
+
+    try:
+        reply = _send({"cmd": action}, timeout=5.0)
+    except OSError:
+        print(f"Daemon busy or not responding ({socket_path()})")
+        return
+    if reply is None:
+        print(f"Daemon not running ({socket_path()})")
+    elif action == "status":
+        state = "busy with a run" if reply.get("busy") else "idle"
+        print(f"Daemon running (pid={reply.get('pid')}, {state}) on {socket_path()}")
+    else:
+        print("Daemon stopping after the current run" if reply.get("busy") else "Daemon stopping")
+
+
+if __name__ == "__main__":
+    p = argparse.ArgumentParser(prog="photogrammetry-odm-daemon", description="Photogrammetry-ODM pipeline daemon")
+    p.add_argument("action", choices=["start", "stop", "status"])
+    daemon_main(p.parse_args(sys.argv[1:]).action)
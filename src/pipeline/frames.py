@@ -1,14 +1,49 @@
 from __future__ import annotations
 
+import functools
+import itertools
 import logging
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from src.utils.subprocess import run_cmd
 
 log = logging.getLogger(__name__)
 
+# Invariant parts of every extraction command
+_FFMPEG_PREFIX = ("ffmpeg", "-hide_banner", "-loglevel", "error", "-y")
+_FFMPEG_THREADS = ("-threads", "0")
+
+# DRM render node used by both QSV and VA-API on Linux
+_HW_RENDER_NODE = "/dev/dri/renderD128"
+
+# encoder -> (global hw init options, extra -vf filters, encoder options)
+# Quality 2 (software) is a good compromise for photogrammetry; hardware
+# quality 92 uses the IJG-scaled tables closest to mjpeg's -q:v 2 matrix.
+_JPEG_ENCODERS = {
+    "mjpeg": ((), "", ("-c:v", "mjpeg", "-q:v", "2")),
+    "mjpeg_qsv": (
+        ("-init_hw_device", "qsv=hw", "-filter_hw_device", "hw"),
+        ",hwupload=extra_hw_frames=64,format=qsv",
+        ("-c:v", "mjpeg_qsv", "-global_quality", "92"),
+    ),
+    "mjpeg_vaapi": (
+        ("-vaapi_device", _HW_RENDER_NODE),
+        ",format=nv12,hwupload",
+        ("-c:v", "mjpeg_vaapi", "-global_quality", "92"),
+    ),
+}
+
+# Set after a hardware encoder fails mid-run, so later runs go straight to software
+_hw_jpeg_disabled = False
+
+# Below this many deletions a thread pool costs more than it saves.
+_PARALLEL_UNLINK_MIN = 64
+
 
 @dataclass(frozen=True)
 class FrameExtractParams:
@@ -31,11 +66,18 @@ class FrameExtractParams:
         duration_seconds (float):
             Duration (in seconds) of the video segment to extract frames from.
             If 0, extraction continues until the end of the video.
+
+        segments (Tuple[Tuple[float, float], ...]):
+            Optional (start, duration) time ranges, in seconds, extracted
+            together in a single ffmpeg pass. A duration of 0 means "until
+            the end of the video". When set, `start_seconds` and
+            `duration_seconds` are ignored.
     """
     fps: float
     max_frames: int
     start_seconds: float
     duration_seconds: float
+    segments: Tuple[Tuple[float, float], ...] = ()
 
 
 def extract_frames(video_path: Path, out_dir: Path, params: FrameExtractParams) -> Path:
@@ -50,12 +92,21 @@ def extract_frames(video_path: Path, out_dir: Path, params: FrameExtractParams)
         ...
 
     The extraction is controlled by the FrameExtractParams object, which supports:
-      - start offset (-ss)
+      - start offset (-ss, input-side seek; frames start exactly at the offset)
       - duration (-t)
       - fps filter (-vf fps=...)
+      - frame cap (-frames:v), so ffmpeg stops once max_frames are written
+      - several time ranges at once (select=between(t,...)+...), so
+        disjoint segments cost one ffmpeg process instead of one each
+
+    JPEGs are encoded with the `mjpeg` encoder on all cores, or with a
+    hardware MJPEG encoder (QSV / VA-API) when ffmpeg exposes one and the
+    device passes a test encode (see `_jpeg_encoder()`). If the hardware
+    run fails and the device no longer works, the run is retried in
+    software and hardware encoding stays off for the rest of the process.
 
-    After extraction, the function optionally limits the number of frames
-    using `_cap_frames()`.
+    After extraction, `cap_frames()` is still applied as a safeguard
+    (e.g. stale frames left in the directory by a previous run).
 
     Args:
         video_path (Path):
@@ -73,47 +124,219 @@ def extract_frames(video_path: Path, out_dir: Path, params: FrameExtractParams)
     """
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    # Build ffmpeg command
+    out_pattern = out_dir / "frame_%06d.jpg"
+    encoder = _jpeg_encoder()
+
+    try:
+        run_cmd(_build_ffmpeg_cmd(video_path, out_pattern, params, encoder))
+    except RuntimeError:
+        # A device that still passes the test encode means the input itself
+        # is at fault (corrupt file, bad offset): don't re-run in software
+        if encoder == "mjpeg" or _encoder_works(encoder):
+            raise
+        global _hw_jpeg_disabled
+        _hw_jpeg_disabled = True
+        log.warning("Hardware JPEG encoder %s failed; using software mjpeg from now on", encoder)
+        run_cmd(_build_ffmpeg_cmd(video_path, out_pattern, params, "mjpeg"))
+
+    # ffmpeg already stopped at max_frames; this only removes leftovers
+    if params.max_frames and params.max_frames > 0:
+        cap_frames(out_dir, params.max_frames)
+
+    return out_dir
+
+
+def _build_ffmpeg_cmd(video_path: Path, out_pattern: Path, params: FrameExtractParams, encoder: str) -> list[str]:
+    """
+    Build the ffmpeg frame extraction command for a given JPEG encoder.
+
+    Args:
+        video_path (Path):
+            Path to the input video file.
+
+        out_pattern (Path):
+            Output filename pattern (e.g. out_dir / "frame_%06d.jpg").
+
+        params (FrameExtractParams):
+            Extraction parameters.
+
+        encoder (str):
+            Key of `_JPEG_ENCODERS` ("mjpeg", "mjpeg_qsv", "mjpeg_vaapi").
+
+    Returns:
+        list[str]:
+            Command tokens ready for `run_cmd()`.
+    """
+    hw_init, vf_suffix, enc_opts = _JPEG_ENCODERS[encoder]
+    if params.segments:
+        return _build_segments_cmd(video_path, out_pattern, params, hw_init, vf_suffix, enc_opts)
+
     # -ss and -t are optional
-    cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y"]
+    parts = [_FFMPEG_PREFIX, hw_init]
 
+    # Input-side seek: jumps to the nearest keyframe, then decodes up to the exact offset
     if params.start_seconds and params.start_seconds > 0:
-        cmd += ["-ss", str(params.start_seconds)]
+        parts.append(("-ss", str(params.start_seconds)))
 
-    cmd += ["-i", str(video_path)]
+    # Use hardware decode (VA-API/NVDEC/...) when available; ffmpeg falls back to CPU
+    parts.append(("-hwaccel", "auto", "-i", str(video_path)))
 
     if params.duration_seconds and params.duration_seconds > 0:
-        cmd += ["-t", str(params.duration_seconds)]
+        parts.append(("-t", str(params.duration_seconds)))
 
-    # fps filter
-    vf = f"fps={params.fps}"
+    # fps filter (+ upload to the device for hardware encoders)
+    parts += [("-vf", f"fps={params.fps}{vf_suffix}"), enc_opts, _FFMPEG_THREADS]
 
-    # Use quality 2 for jpg, good compromise
-    out_pattern = out_dir / "frame_%06d.jpg"
+    # Stop decoding/encoding once enough frames are written
+    if params.max_frames and params.max_frames > 0:
+        parts.append(("-frames:v", str(params.max_frames)))
 
-    cmd += [
-        "-vf", vf,
-        "-q:v", "2",
-        str(out_pattern),
-    ]
+    parts.append((str(out_pattern),))
+    return list(itertools.chain.from_iterable(parts))
+
+
+def _build_segments_cmd(
+    video_path: Path,
+    out_pattern: Path,
+    params: FrameExtractParams,
+    hw_init: Tuple[str, ...],
+    vf_suffix: str,
+    enc_opts: Tuple[str, ...],
+) -> list[str]:
+    """
+    Build one ffmpeg command extracting frames from several time ranges.
+
+    The input is seeked to the earliest segment start and read only up
+    to the latest segment end. `-copyts` keeps source timestamps, so the
+    `select` filter can match each segment by absolute time, and
+    `-vsync vfr` drops (rather than duplicates) frames between segments.
+
+    Args:
+        video_path (Path):
+            Path to the input video file.
+
+        out_pattern (Path):
+            Output filename pattern (e.g. out_dir / "frame_%06d.jpg").
+
+        params (FrameExtractParams):
+            Extraction parameters with non-empty `segments`.
+
+        hw_init, vf_suffix, enc_opts:
+            Encoder settings from `_JPEG_ENCODERS`.
 
-    # Execute ffmpeg extraction command
-    run_cmd(cmd)
+    Returns:
+        list[str]:
+            Command tokens ready for `run_cmd()`.
+    """
+    lo = min(start for start, _ in params.segments)
+    ends = [start + dur if dur > 0 else None for start, dur in params.segments]
+    hi = None if None in ends else max(ends)
 
-    # Optionally cap number of frames
+    terms = [
+        f"between(t,{start},{end})" if end is not None else f"gte(t,{start})"
+        for (start, _), end in zip(params.segments, ends)
+    ]
+
+    parts = [_FFMPEG_PREFIX, hw_init]
+    if lo > 0:
+        parts.append(("-ss", str(lo)))
+    if hi is not None:
+        # Input-side duration: stop reading after the last segment
+        parts.append(("-t", str(hi - lo)))
+    parts.append(("-hwaccel", "auto", "-i", str(video_path), "-copyts"))
+
+    select = "+".join(terms)
+    parts += [
+        ("-vf", f"fps={params.fps},select='{select}'{vf_suffix}", "-vsync", "vfr"),
+        enc_opts,
+        _FFMPEG_THREADS,
+    ]
     if params.max_frames and params.max_frames > 0:
-        _cap_frames(out_dir, params.max_frames)
+        parts.append(("-frames:v", str(params.max_frames)))
 
-    return out_dir
+    parts.append((str(out_pattern),))
+    return list(itertools.chain.from_iterable(parts))
 
 
-def _cap_frames(out_dir: Path, max_frames: int) -> None:
+def _jpeg_encoder() -> str:
+    """
+    Return the JPEG encoder to use for the next extraction.
+
+    Returns:
+        str:
+            Key of `_JPEG_ENCODERS`: the probed hardware encoder, or
+            "mjpeg" if none is usable or one has already failed a run.
+    """
+    return "mjpeg" if _hw_jpeg_disabled else _probe_jpeg_encoder()
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_jpeg_encoder() -> str:
+    """
+    Pick the fastest working JPEG encoder of the local ffmpeg build.
+
+    Runs `ffmpeg -encoders` once per process and prefers Intel QSV or
+    VA-API hardware MJPEG encoders, but only if the render node exists
+    and a 1-frame test encode succeeds; a compiled-in encoder says
+    nothing about the device being present. Falls back to software `mjpeg`.
+
+    Returns:
+        str:
+            Key of `_JPEG_ENCODERS`.
+    """
+    if not os.path.exists(_HW_RENDER_NODE):
+        return "mjpeg"
+    try:
+        p = subprocess.run(["ffmpeg", "-hide_banner", "-encoders"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return "mjpeg"
+    for name in ("mjpeg_qsv", "mjpeg_vaapi"):
+        if f" {name} " in p.stdout and _encoder_works(name):
+            log.info("Using hardware JPEG encoder: %s", name)
+            return name
+    return "mjpeg"
+
+
+def _encoder_works(encoder: str) -> bool:
+    """
+    Encode a single synthetic frame to check that an encoder's device works.
+
+    Args:
+        encoder (str):
+            Key of `_JPEG_ENCODERS`.
+
+    Returns:
+        bool:
+            True if ffmpeg encoded the frame successfully.
+    """
+    hw_init, vf_suffix, enc_opts = _JPEG_ENCODERS[encoder]
+    cmd = [
+        *_FFMPEG_PREFIX, *hw_init,
+        "-f", "lavfi", "-i", "color=c=gray:s=64x64",
+        "-vf", f"format=nv12{vf_suffix}", *enc_opts,
+        "-frames:v", "1", "-f", "null", "-",
+    ]
+    try:
+        return subprocess.run(cmd, capture_output=True, timeout=10).returncode == 0
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+
+def cap_frames(out_dir: Path, max_frames: int) -> None:
     """
     Remove frames beyond a maximum count.
 
-    This function scans the output directory for extracted frames,
-    sorts them in filename order, and deletes any frames after the
-    first `max_frames`.
+    `extract_frames()` already caps extraction inside ffmpeg; this helper
+    is kept for directories populated some other way (pre-extracted frames).
+
+    This function scans the output directory for extracted frames and
+    deletes any frame whose name sorts after `frame_<max_frames>.jpg`.
+
+    Since ffmpeg numbers frames sequentially from 1 with zero padding,
+    a plain lexical comparison against that threshold name selects the
+    tail directly, without building and sorting a list of every frame.
+    Large deletions are dispatched through a thread pool so the
+    individual `unlink` calls can overlap.
 
     This is useful when extracting at a high FPS but wanting to
     limit the total number of frames passed into photogrammetry.
@@ -129,10 +352,36 @@ def _cap_frames(out_dir: Path, max_frames: int) -> None:
     Returns:
         None
     """
-    frames = sorted(out_dir.glob("frame_*.jpg"))
-    if len(frames) <= max_frames:
+    threshold = f"frame_{max_frames:06d}.jpg"
+    with os.scandir(out_dir) as it:
+        victims = [
+            e.path for e in it
+            if e.name > threshold and e.name.startswith("frame_") and e.name.endswith(".jpg")
+        ]
+    if not victims:
         return
-    to_delete = frames[max_frames:]
-    for p in to_delete:
-        p.unlink(missing_ok=True)
-    log.info("Capped frames to %d (deleted %d)", max_frames, len(to_delete))
+    if len(victims) < _PARALLEL_UNLINK_MIN:
+        for p in victims:
+            _unlink_quiet(p)
+    else:
+        # unlink is a blocking metadata syscall; overlap them across threads
+        with ThreadPoolExecutor(max_workers=min(32, len(victims))) as ex:
+            list(ex.map(_unlink_quiet, victims))
+    log.info("Capped frames to %d (deleted %d)", max_frames, len(victims))
+
+
+def _unlink_quiet(path: str) -> None:
+    """
+    Delete a file, ignoring it if it is already gone.
+
+    Args:
+        path (str):
+            File path to delete.
+
+    Returns:
+        None
+    """
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
@@ -1,16 +1,57 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import os
+import re
+import threading
+import time
 from urllib.parse import urlparse
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from pyodm import Node, exceptions
 
 log = logging.getLogger(__name__)
 
 
+def _make_session() -> requests.Session:
+    """
+    Build the shared HTTP session used for NodeODM API calls and downloads.
+
+    The mounted adapter keeps connections alive per host (one handshake
+    instead of one per request) and retries transient gateway errors.
+
+    Returns:
+        requests.Session:
+            Session with pooled, retrying adapters for http and https.
+    """
+    session = requests.Session()
+    # raise_on_status=False: hand the final 5xx back to the caller instead of RetryError
+    retry = Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504], raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _make_session()
+
+# Separators accepted between hosts in ODM_HOST (commas and/or any whitespace)
+_HOST_SPLIT = re.compile(r"[\s,]+")
+
+# base_url -> (monotonic timestamp, (running, queued, active))
+_LOAD_CACHE: dict[str, tuple[float, tuple[int, int, int]]] = {}
+_LOAD_CACHE_LOCK = threading.Lock()
+_LOAD_CACHE_TTL_S = 5.0
+# After a failed probe, a cached load is reused for at most this many TTLs
+_LOAD_CACHE_STALE_FACTOR = 3
+
+
 def get_odm_hosts(host_env: str, default: str) -> list[str]:
     """
     Return one or more NodeODM host URLs.
@@ -40,7 +81,7 @@ def get_odm_hosts(host_env: str, default: str) -> list[str]:
     """
     raw = os.getenv(host_env, default)
     # Allow commas or whitespace as separators.
-    parts = [p.strip() for p in raw.replace("\n", ",").replace(" ", ",").split(",") if p.strip()]
+    parts = [p for p in _HOST_SPLIT.split(raw.strip()) if p]
     return parts or [default]
 
 
@@ -65,9 +106,10 @@ def get_odm_host(host_env: str, default: str) -> str:
     return get_odm_hosts(host_env, default)[0]
 
 
-def _parse_host_port(odm_host: str) -> tuple[str, int]:
+@functools.lru_cache(maxsize=64)
+def _parse_host(odm_host: str) -> tuple[str, str, int, str]:
     """
-    Parse a NodeODM host string into (hostname, port).
+    Parse a NodeODM host string once into all the parts callers need.
 
     Supported formats:
       - http://nodeodm:3000
@@ -75,28 +117,42 @@ def _parse_host_port(odm_host: str) -> tuple[str, int]:
       - nodeodm:3000
       - nodeodm   (defaults to port 3000)
 
+    Results are memoized, so the pipeline's repeated normalize/connect
+    calls for the same host do not re-run urlparse.
+
     Args:
         odm_host (str):
             NodeODM host string.
 
     Returns:
-        tuple[str, int]:
-            Parsed hostname and port number.
+        tuple[str, str, int, str]:
+            (scheme, hostname, port, base_url), with base_url in the
+            form scheme://host:port.
     """
     s = odm_host.strip()
+    if "://" not in s:
+        s = "http://" + s
+    # keep as provided (NodeODM is usually plain http)
+    u = urlparse(s)
+    scheme = u.scheme or "http"
+    host = u.hostname or "localhost"
+    port = int(u.port or 3000)
+    return scheme, host, port, f"{scheme}://{host}:{port}"
 
-    if "://" in s:
-        u = urlparse(s)
-        host = u.hostname or "localhost"
-        port = u.port or 3000
-        return host, int(port)
 
-    # no scheme
-    if ":" in s:
-        host, port_s = s.rsplit(":", 1)
-        return host, int(port_s)
+def _parse_host_port(odm_host: str) -> tuple[str, int]:
+    """
+    Parse a NodeODM host string into (hostname, port).
 
-    return s, 3000
+    Args:
+        odm_host (str):
+            NodeODM host string (see `_parse_host()` for formats).
+
+    Returns:
+        tuple[str, int]:
+            Parsed hostname and port number.
+    """
+    return _parse_host(odm_host)[1:3]
 
 
 def connect(odm_host: str) -> Node:
@@ -106,7 +162,11 @@ def connect(odm_host: str) -> Node:
     This function creates a `pyodm.Node` object and performs a basic
     `node.info()` request to ensure the server is reachable.
 
-    If the connection fails, a RuntimeError is raised.
+    Validated nodes are memoized per (host, port), so repeated connects
+    to the same server in one process (e.g. daemon or batch runs) skip
+    the round-trip. Use `connect.cache_clear()` to drop them.
+
+    If the connection fails, a RuntimeError is raised (and nothing is cached).
 
     Args:
         odm_host (str):
@@ -121,9 +181,97 @@ def connect(odm_host: str) -> Node:
             If NodeODM is unreachable or returns connection errors.
     """
     host, port = _parse_host_port(odm_host)
+    return _cached_node(host, port)
+
+
+class _PooledNode(Node):
+    """
+    pyodm Node whose HTTP calls go through the shared keep-alive session.
+
+    pyodm issues every request with module-level `requests.get/post`,
+    i.e. a fresh TCP connection per call. Routing `get()`/`post()`
+    through `_SESSION` keeps connections alive for the whole task:
+    image uploads (up to `parallel_uploads` at once), status polls and
+    asset downloads. Status handling mirrors pyodm's own.
+    """
+
+    def get(self, url, query=None, **kwargs):
+        try:
+            res = _SESSION.get(self.url(url, dict(query or {})), timeout=self.timeout, **kwargs)
+            return _node_result(res, ok=(200, 403, 206))
+        except requests.exceptions.JSONDecodeError as e:
+            raise exceptions.NodeServerError(str(e))
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+            raise exceptions.NodeConnectionError(str(e))
+
+    def post(self, url, data=None, headers=None):
+        try:
+            res = _SESSION.post(self.url(url), data=data, headers=headers or {}, timeout=self.timeout)
+            return _node_result(res, ok=(200, 403))
+        except requests.exceptions.JSONDecodeError as e:
+            raise exceptions.NodeServerError(str(e))
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+            raise exceptions.NodeConnectionError(str(e))
+
+
+def _node_result(res: requests.Response, ok: tuple[int, ...]):
+    """
+    Validate a NodeODM response the way pyodm does.
+
+    Args:
+        res (requests.Response):
+            HTTP response.
+
+        ok (tuple[int, ...]):
+            Accepted status codes.
+
+    Returns:
+        Any:
+            Decoded JSON for JSON responses, otherwise the response itself.
+
+    Raises:
+        NodeResponseError:
+            On 401 or a JSON body carrying an "error" key.
+
+        NodeServerError:
+            On any other unexpected status code.
+    """
+    if res.status_code == 401:
+        raise exceptions.NodeResponseError("Unauthorized. Do you need to set a token?")
+    if res.status_code not in ok:
+        raise exceptions.NodeServerError(f"Unexpected status code: {res.status_code}")
+
+    if "application/json" in res.headers.get("Content-Type", ""):
+        result = res.json()
+        if isinstance(result, dict) and "error" in result:
+            raise exceptions.NodeResponseError(result["error"])
+        return result
+    return res
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_node(host: str, port: int) -> Node:
+    """
+    Create and validate a pyodm Node once per (host, port).
+
+    Args:
+        host (str):
+            NodeODM hostname.
+
+        port (int):
+            NodeODM port.
+
+    Returns:
+        Node:
+            Connected pyodm Node instance.
+
+    Raises:
+        RuntimeError:
+            If NodeODM is unreachable or returns connection errors.
+    """
     log.info("Connecting to NodeODM: host=%s port=%s", host, port)
 
-    node = Node(host, port)
+    node = _PooledNode(host, port)
     try:
         info = node.info()
 
@@ -145,6 +293,9 @@ def connect(odm_host: str) -> Node:
     return node
 
 
+connect.cache_clear = _cached_node.cache_clear
+
+
 def _normalize_base_url(odm_host: str) -> str:
     """
     Normalize a NodeODM host string into a valid base URL.
@@ -163,30 +314,154 @@ def _normalize_base_url(odm_host: str) -> str:
         str:
             Normalized base URL in the form: scheme://host:port
     """
-    s = odm_host.strip()
-    if "://" not in s:
-        s = "http://" + s
-    # keep as provided (NodeODM is usually plain http)
-    u = urlparse(s)
-    host = u.hostname or "localhost"
-    port = u.port or 3000
-    scheme = u.scheme or "http"
-    return f"{scheme}://{host}:{port}"
+    return _parse_host(odm_host)[3]
+
 
+def _load_cache_ttl() -> float:
+    """
+    Return the `_node_load()` cache TTL in seconds.
+
+    Defaults to 5 seconds; override with the `ODM_LOAD_CACHE_TTL`
+    environment variable (0 disables caching).
+
+    Returns:
+        float:
+            TTL in seconds.
+    """
+    raw = os.getenv("ODM_LOAD_CACHE_TTL")
+    if not raw:
+        return _LOAD_CACHE_TTL_S
+    try:
+        return float(raw)
+    except ValueError:
+        log.warning("Ignoring invalid ODM_LOAD_CACHE_TTL=%r", raw)
+        return _LOAD_CACHE_TTL_S
+
+
+async def _node_load(
+    client: httpx.AsyncClient, base_url: str, timeout_s: float = 2.0, ttl_s: float | None = None
+) -> tuple[tuple[int, int, int], bool]:
+    """
+    Return a NodeODM instance's workload, cached for a short TTL.
 
-def _node_load(base_url: str, timeout_s: float = 2.0) -> tuple[int, int, int]:
+    The cheap `GET /info` endpoint is tried first (`_node_info()`); the
+    full task scan (`_probe_node_load()`) is only used when /info does
+    not report queue stats.
+
+    Results younger than `ttl_s` are served from an in-process cache,
+    so bursts of `pick_best_odm_host()` calls don't re-probe every host.
+    If a fresh probe fails, the last known result is returned instead,
+    flagged as stale, as long as it is younger than
+    `_LOAD_CACHE_STALE_FACTOR` TTLs; older entries are evicted and the
+    probe error is raised, so a dead host stops looking healthy.
+
+    Args:
+        client (httpx.AsyncClient):
+            Shared client used for all probe requests.
+
+        base_url (str):
+            Normalized base URL for NodeODM.
+
+        timeout_s (float):
+            Request timeout in seconds for each HTTP call.
+
+        ttl_s (float | None):
+            Cache lifetime in seconds. None uses `_load_cache_ttl()`.
+
+    Returns:
+        tuple[tuple[int, int, int], bool]:
+            ((running_tasks, queued_tasks, active_tasks), stale), where
+            active_tasks = running + queued whichever probe was used, and
+            stale is True if the probe failed and a cached load was used.
+
+    Raises:
+        Exception:
+            Whatever the probe raised, if there is no recent enough
+            cached result to fall back to.
+    """
+    ttl = _load_cache_ttl() if ttl_s is None else ttl_s
+    with _LOAD_CACHE_LOCK:
+        cached = _LOAD_CACHE.get(base_url)
+    if cached is not None and time.monotonic() - cached[0] < ttl:
+        return cached[1], False
+
+    try:
+        load = await _node_info(client, base_url, timeout_s) or await _probe_node_load(client, base_url, timeout_s)
+    except Exception as e:
+        age = time.monotonic() - cached[0] if cached is not None else None
+        if age is None or age >= ttl * _LOAD_CACHE_STALE_FACTOR:
+            if cached is not None:
+                with _LOAD_CACHE_LOCK:
+                    _LOAD_CACHE.pop(base_url, None)
+            raise
+        log.warning("Probe of %s failed (%s); using load from %.0fs ago", base_url, e, age)
+        return cached[1], True
+
+    with _LOAD_CACHE_LOCK:
+        _LOAD_CACHE[base_url] = (time.monotonic(), load)
+    return load, False
+
+
+async def _node_info(client: httpx.AsyncClient, base_url: str, timeout_s: float = 2.0) -> tuple[int, int, int] | None:
+    """
+    Estimate a NodeODM instance's workload from a single `GET /info`.
+
+    NodeODM reports `taskQueueCount` (tasks running or waiting) and
+    `maxParallelTasks` in /info. The running/queued split is estimated
+    from those, which costs one small request instead of one per task.
+    The result means the same as `_probe_node_load()`'s, so hosts
+    probed either way rank on one scale.
+
+    Args:
+        client (httpx.AsyncClient):
+            Shared client used for all probe requests.
+
+        base_url (str):
+            Normalized base URL for NodeODM.
+
+        timeout_s (float):
+            Request timeout in seconds.
+
+    Returns:
+        tuple[int, int, int] | None:
+            (running_tasks, queued_tasks, active_tasks), or None if the
+            response lacks queue stats (older NodeODM versions).
+
+    Raises:
+        httpx.HTTPError:
+            If the host is unreachable or returns an HTTP error.
+    """
+    r = await client.get(f"{base_url}/info", timeout=timeout_s)
+    r.raise_for_status()
+    info = r.json()
+    if not isinstance(info, dict) or "taskQueueCount" not in info:
+        return None
+
+    count = int(info.get("taskQueueCount") or 0)
+    slots = int(info.get("maxParallelTasks") or 0) or count
+    running = min(count, slots)
+    return running, count - running, count
+
+
+async def _probe_node_load(client: httpx.AsyncClient, base_url: str, timeout_s: float = 2.0) -> tuple[int, int, int]:
     """
     Query a NodeODM instance for its current workload.
 
     This function calls:
       - GET /task/list
-      - GET /task/<uuid>/info for each task
+      - GET /task/<uuid>/info for each task (concurrently)
 
     Then counts tasks based on their status code:
       - code 20 = running
       - code 10 = queued
 
+    Finished tasks still listed by the node are not counted, matching
+    what `/info`'s `taskQueueCount` reports (see `_node_info()`).
+
     Args:
+        client (httpx.AsyncClient):
+            Shared client used for all probe requests.
+
         base_url (str):
             Normalized base URL for NodeODM.
 
@@ -195,40 +470,63 @@ def _node_load(base_url: str, timeout_s: float = 2.0) -> tuple[int, int, int]:
 
     Returns:
         tuple[int, int, int]:
-            (running_tasks, queued_tasks, total_tasks)
+            (running_tasks, queued_tasks, active_tasks), with
+            active_tasks = running_tasks + queued_tasks.
+
+    Raises:
+        httpx.HTTPError:
+            If /task/list is unreachable or returns an HTTP error.
     """
     # /task/list returns a list of {uuid: ...}
-    r = requests.get(f"{base_url}/task/list", timeout=timeout_s)
+    r = await client.get(f"{base_url}/task/list", timeout=timeout_s)
     r.raise_for_status()
     items = r.json() or []
     uuids = [it.get("uuid") for it in items if isinstance(it, dict) and it.get("uuid")]
 
+    # Fetch all task infos concurrently: ~1 RTT instead of N
+    replies = await asyncio.gather(
+        *(client.get(f"{base_url}/task/{uid}/info", timeout=timeout_s) for uid in uuids),
+        return_exceptions=True,
+    )
+
     running = queued = 0
-    for uid in uuids:
+    for reply in replies:
+        # If a single task info fails, don't break scheduling.
         try:
-            info = requests.get(f"{base_url}/task/{uid}/info", timeout=timeout_s).json()
-            code = (info.get("status") or {}).get("code")
-            if code == 20:
-                running += 1
-            elif code == 10:
-                queued += 1
+            info = reply.json()
         except Exception:
-            # If a single task info fails, don't break scheduling.
             continue
+        if not isinstance(info, dict):
+            continue
+        code = (info.get("status") or {}).get("code")
+        if code == 20:
+            running += 1
+        elif code == 10:
+            queued += 1
 
-    return running, queued, len(uuids)
+    return running, queued, running + queued
 
 
-def pick_best_odm_host(hosts: list[str], timeout_s: float = 2.0) -> str:
+def pick_best_odm_host(hosts: list[str], timeout_s: float = 2.0, deadline_s: float = 30.0) -> str:
     """
     Pick the least-loaded NodeODM host from a list.
 
-    This function probes each host by calling `_node_load()` and selects
-    the best candidate based on a simple heuristic:
+    This function probes all hosts concurrently on one event loop
+    (`_node_load()` per host, sharing a single keep-alive
+    `httpx.AsyncClient`) and selects the best candidate based on a
+    simple heuristic:
 
-      1) Prefer fewer running tasks
-      2) Then fewer queued tasks
-      3) Then fewer total tasks
+      1) Prefer hosts that answered this probe over hosts whose probe
+         failed and that are ranked on a recently cached (stale) load
+      2) Then fewer running tasks
+      3) Then fewer queued tasks
+      4) Then fewer active (running + queued) tasks
+      5) Then earlier position in `hosts`
+
+    Total wall time is bounded by the slowest host, and never exceeds
+    `deadline_s`; hosts still probing at the deadline are skipped.
+    As soon as a host reports no active tasks in a fresh probe, it is
+    returned and the remaining probes are cancelled.
 
     If all hosts fail probing (network error, timeout, etc.),
     the function falls back to the first host.
@@ -240,6 +538,9 @@ def pick_best_odm_host(hosts: list[str], timeout_s: float = 2.0) -> str:
         timeout_s (float):
             Timeout for HTTP probing requests.
 
+        deadline_s (float):
+            Overall time budget (seconds) for probing all hosts.
+
     Returns:
         str:
             The selected NodeODM host.
@@ -251,15 +552,48 @@ def pick_best_odm_host(hosts: list[str], timeout_s: float = 2.0) -> str:
     if not hosts:
         raise ValueError("hosts must be non-empty")
 
-    best: tuple[int, int, int, str] | None = None
-    for h in hosts:
-        base = _normalize_base_url(h)
-        try:
-            running, queued, total = _node_load(base, timeout_s=timeout_s)
-            cand = (running, queued, total, h)
-            if best is None or cand[:3] < best[:3]:
-                best = cand
-        except Exception:
-            continue
+    results = asyncio.run(_probe_hosts(hosts, timeout_s, deadline_s))
+    return hosts[min(results)[4]] if results else hosts[0]
+
 
-    return (best[3] if best is not None else hosts[0])
+async def _probe_hosts(hosts: list[str], timeout_s: float, deadline_s: float) -> list[tuple[bool, int, int, int, int]]:
+    """
+    Probe `hosts` concurrently and collect (stale, running, queued, active, index) tuples.
+
+    Hosts that fail or miss the deadline are left out; probing stops
+    early at the first freshly probed idle host.
+    """
+    results: list[tuple[bool, int, int, int, int]] = []
+    limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+    transport = httpx.AsyncHTTPTransport(retries=2, limits=limits)
+    async with httpx.AsyncClient(transport=transport, timeout=timeout_s) as client:
+        probes = {
+            asyncio.ensure_future(_node_load(client, _normalize_base_url(h), timeout_s)): i
+            for i, h in enumerate(hosts)
+        }
+        pending = set(probes)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + deadline_s
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, timeout=deadline - loop.time(), return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    log.warning("NodeODM probing exceeded %.0fs; ignoring hosts that did not answer", deadline_s)
+                    break
+                for fut in done:
+                    if fut.exception() is not None:
+                        continue
+                    (running, queued, active), stale = fut.result()
+                    results.append((stale, running, queued, active, probes[fut]))
+                    if not stale and (running, queued, active) == (0, 0, 0):
+                        # An idle host is always tied for best; stop probing
+                        return results
+        finally:
+            # Don't wait on stragglers (deadline hit or idle host found)
+            for fut in pending:
+                fut.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    return results
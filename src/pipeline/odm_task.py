@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-import time
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, List, Mapping, Optional
 
 from pyodm import Node, exceptions
 from tqdm import tqdm
@@ -12,14 +15,14 @@ from tqdm import tqdm
 log = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ODMTaskParams:
     """
     Parameters controlling NodeODM task submission and monitoring.
 
     Attributes:
-        options (Dict[str, Any]):
-            Dictionary of ODM processing options (passed directly to NodeODM).
+        options (Mapping[str, Any]):
+            Read-only mapping of ODM processing options (passed directly to NodeODM).
             Example:
                 {"dsm": True, "pc-ept": True, "mesh_size": 200000}
 
@@ -29,12 +32,12 @@ class ODMTaskParams:
         poll_seconds (int):
             Polling interval (seconds) for checking task status.
     """
-    options: Dict[str, Any]
+    options: Mapping[str, Any]
     parallel_uploads: int
     poll_seconds: int
 
 
-def submit_task(node: Node, images_dir: Path, params: ODMTaskParams):
+def submit_task(node: Node, images_dir: Path, params: ODMTaskParams, shard_hosts: Optional[List[str]] = None):
     """
     Submit a photogrammetry task to NodeODM using a folder of extracted images.
 
@@ -43,6 +46,14 @@ def submit_task(node: Node, images_dir: Path, params: ODMTaskParams):
 
     It also logs upload progress every 5%.
 
+    Sharded submission (opt-in):
+        If `shard_hosts` is given, the images are split round-robin
+        (images[i::K]) across `node` plus one node per extra host, and
+        all shards are uploaded in parallel. Each shard becomes an
+        independent ODM task, so this trades reconstruction quality
+        (no shared image set) for upload/processing speed; it is meant
+        for preview/validation runs.
+
     Args:
         node (Node):
             Connected pyodm Node instance.
@@ -53,20 +64,63 @@ def submit_task(node: Node, images_dir: Path, params: ODMTaskParams):
         params (ODMTaskParams):
             Task submission parameters including ODM options and upload settings.
 
+        shard_hosts (Optional[List[str]]):
+            Additional NodeODM hosts to shard the images across.
+
     Returns:
-        Task:
-            A pyodm Task object (type depends on pyodm version).
+        Task | List[Task]:
+            A pyodm Task object (type depends on pyodm version), or a list
+            of tasks (one per shard, `node` first) when `shard_hosts` is given.
 
     Raises:
         ValueError:
             If no .jpg images are found in the directory.
     """
-    images = sorted(str(p) for p in images_dir.glob("*.jpg"))
+    # One scandir pass; no per-entry fnmatch or Path construction
+    with os.scandir(images_dir) as it:
+        images = sorted([e.path for e in it if e.name.endswith(".jpg") and e.is_file(follow_symlinks=False)])
     if not images:
         raise ValueError(f"No images found in {images_dir}")
 
-    log.info("Submitting ODM task with %d images", len(images))
+    if shard_hosts is None:
+        log.info("Submitting ODM task with %d images", len(images))
+        return _create_task(node, images, params, label="Upload")
+
+    # Deferred to keep odm_task importable without the HTTP client stack
+    from src.pipeline.odm_client import connect
+
+    nodes = [node] + [connect(h) for h in shard_hosts]
+    k = len(nodes)
+    log.info("Submitting %d sharded ODM tasks with %d images total", k, len(images))
+    with ThreadPoolExecutor(max_workers=k) as ex:
+        futures = [
+            ex.submit(_create_task, n, images[i::k], params, f"Upload shard {i + 1}/{k}")
+            for i, n in enumerate(nodes)
+        ]
+        return [f.result() for f in futures]
+
+
+def _create_task(node: Node, images: List[str], params: ODMTaskParams, label: str):
+    """
+    Upload a list of images to one NodeODM node and create the task.
+
+    Args:
+        node (Node):
+            Connected pyodm Node instance.
+
+        images (List[str]):
+            Image paths to upload.
+
+        params (ODMTaskParams):
+            Task submission parameters including ODM options and upload settings.
+
+        label (str):
+            Prefix for upload progress log lines.
 
+    Returns:
+        Task:
+            A pyodm Task object (type depends on pyodm version).
+    """
     last = {"p": -1}
 
     def on_upload(pct: float):
@@ -82,7 +136,7 @@ def submit_task(node: Node, images_dir: Path, params: ODMTaskParams):
         p = int(pct)
         if p >= last["p"] + 5:
             last["p"] = p
-            log.info("Upload progress: %d%%", p)
+            log.info("%s progress: %d%%", label, p)
 
     task = node.create_task(
         files=images,  # IMPORTANT: pyodm expects a list[str], not Path objects
@@ -92,7 +146,7 @@ def submit_task(node: Node, images_dir: Path, params: ODMTaskParams):
     )
 
     uuid = getattr(task, "uuid", None) or getattr(task, "task_id", None) or str(task)
-    log.info("Task created: %s", uuid)
+    log.info("Task created: %s (%d images)", uuid, len(images))
     return task
 
 
@@ -157,16 +211,17 @@ def _status_to_str(status: Any) -> str:
     return str(status)
 
 
-def wait_for_completion(task, poll_seconds: int, max_connection_errors: int = 30) -> None:
+def wait_for_completion(
+    task,
+    poll_seconds: int,
+    max_connection_errors: int = 30,
+    max_poll_seconds: float = 60.0,
+) -> None:
     """
     Poll NodeODM until the task finishes (COMPLETED/FAILED/CANCELED).
 
-    This function repeatedly calls `task.info()` until completion.
-    It shows a tqdm progress bar based on NodeODM-reported progress.
-
-    It is resilient to transient connection failures:
-      - NodeConnectionError will be retried up to max_connection_errors times
-      - NodeResponseError (task not found) fails immediately
+    Single-task shim around `wait_for_many()`; see there for the polling,
+    backoff, progress bar, and error handling behavior.
 
     Args:
         task:
@@ -178,6 +233,9 @@ def wait_for_completion(task, poll_seconds: int, max_connection_errors: int = 30
         max_connection_errors (int):
             Maximum consecutive connection errors allowed before failing.
 
+        max_poll_seconds (float):
+            Upper bound for the adaptive polling interval.
+
     Returns:
         None
 
@@ -185,68 +243,176 @@ def wait_for_completion(task, poll_seconds: int, max_connection_errors: int = 30
         RuntimeError:
             If the task fails, is canceled, disappears, or NodeODM becomes unreachable.
     """
+    wait_for_many([task], poll_seconds, max_connection_errors=max_connection_errors, max_poll_seconds=max_poll_seconds)
+
+
+@dataclass
+class _PollState:
     """
-    Poll until COMPLETED/FAILED/CANCELED.
-    Retries transient NodeODM connection errors.
+    Mutable per-task bookkeeping used by `_wait_many()`.
+
+    Attributes:
+        task:
+            pyodm Task object being polled.
+
+        uuid (Optional[str]):
+            Task id, for log and error messages.
+
+        pbar (tqdm):
+            Progress bar of this task.
+
+        last_progress (int):
+            Last progress value seen.
+
+        conn_errors (int):
+            Consecutive connection errors.
     """
-    pbar = tqdm(total=100, desc="ODM", unit="%")
-    last_progress = -1
-    consecutive_conn_errors = 0
-
-    uuid = getattr(task, "uuid", None) or getattr(task, "task_id", None)
-
-    while True:
-        try:
-            info = task.info()
-            consecutive_conn_errors = 0
-        except exceptions.NodeConnectionError as e:
-            consecutive_conn_errors += 1
-            log.warning(
-                "NodeODM connection error while polling task %s (%s). Retry %d/%d in %ds...",
-                uuid, e, consecutive_conn_errors, max_connection_errors, poll_seconds
-            )
-            if consecutive_conn_errors >= max_connection_errors:
-                pbar.close()
-                raise RuntimeError(
-                    f"Lost connection to NodeODM while polling task {uuid}. "
-                    f"NodeODM may have crashed or storage may be misconfigured."
-                ) from e
-            time.sleep(poll_seconds)
-            continue
-        except exceptions.NodeResponseError as e:
-            # This is the “<uuid> not found” case.
-            pbar.close()
-            raise RuntimeError(
-                f"NodeODM says task {uuid} was not found. "
-                f"This almost always means the task was not persisted (storage/volume problem) "
-                f"or NodeODM was restarted without persistent /var/www/data.\n"
-                f"Original error: {e}"
-            ) from e
-
-        status_raw = _safe(info, "status")
-        status = _status_to_str(status_raw)
-        progress = int(_safe(info, "progress", 0) or 0)
-        last_error = _safe(info, "last_error", None)
-
-        if progress != last_progress:
-            pbar.n = max(0, min(100, progress))
-            pbar.refresh()
-            last_progress = progress
-
-        if status in ("COMPLETED", "FAILED", "CANCELED"):
-            if status == "COMPLETED":
-                pbar.n = 100
-                pbar.refresh()
-                pbar.close()
-                log.info("ODM task completed.")
-                return
+    task: Any
+    uuid: Optional[str]
+    pbar: Any
+    last_progress: int = -1
+    conn_errors: int = 0
+
+
+def wait_for_many(
+    tasks: List[Any],
+    poll_seconds: int,
+    max_connection_errors: int = 30,
+    max_poll_seconds: float = 60.0,
+) -> None:
+    """
+    Poll several NodeODM tasks concurrently until all of them complete.
+
+    Each tick, all unfinished tasks' `task.info()` calls run in parallel
+    (asyncio.gather over the default thread pool), so detection latency
+    stays ~poll_seconds no matter how many tasks are polled. Every task
+    gets its own tqdm progress bar, advanced with `update()` so tqdm's
+    `mininterval` throttles redraws (5s when stderr is not a terminal)
+    to keep log output small.
+
+    The polling interval adapts: it starts at `poll_seconds`, grows by
+    1.5x per tick while no task's progress changes (up to
+    `max_poll_seconds`), and resets whenever progress moves. While any
+    task is at 95% or more it stays at `poll_seconds` so completion is
+    detected promptly.
 
-            pbar.close()
-            raise RuntimeError(
-                f"ODM task ended with status={status}. last_error={last_error}. info={info}"
+    It is resilient to transient connection failures:
+      - NodeConnectionError will be retried up to max_connection_errors times (per task)
+      - NodeResponseError (task not found) fails immediately
+
+    Args:
+        tasks (List[Any]):
+            pyodm Task objects returned from node.create_task().
+
+        poll_seconds (int):
+            Base number of seconds to wait between polls.
+
+        max_connection_errors (int):
+            Maximum consecutive connection errors allowed before failing.
+
+        max_poll_seconds (float):
+            Upper bound for the adaptive polling interval.
+
+    Returns:
+        None
+
+    Raises:
+        RuntimeError:
+            On the first task that fails, is canceled, disappears,
+            or whose NodeODM becomes unreachable.
+    """
+    asyncio.run(_wait_many(tasks, poll_seconds, max_connection_errors, max_poll_seconds))
+
+
+async def _wait_many(tasks: List[Any], poll_seconds: int, max_connection_errors: int, max_poll_seconds: float) -> None:
+    """
+    Event-loop implementation of `wait_for_many()`.
+    """
+    loop = asyncio.get_running_loop()
+    # Non-interactive output (CI logs, files): redraw rarely
+    mininterval = 0.1 if sys.stderr.isatty() else 5.0
+    pending = []
+    for i, task in enumerate(tasks):
+        desc = "ODM" if len(tasks) == 1 else f"ODM {i + 1}/{len(tasks)}"
+        pending.append(_PollState(
+            task=task,
+            uuid=getattr(task, "uuid", None) or getattr(task, "task_id", None),
+            pbar=tqdm(total=100, desc=desc, unit="%", position=i, mininterval=mininterval),
+        ))
+    all_states = list(pending)
+    interval = float(poll_seconds)
+
+    try:
+        while pending:
+            infos = await asyncio.gather(
+                *(loop.run_in_executor(None, st.task.info) for st in pending),
+                return_exceptions=True,
             )
 
-        time.sleep(poll_seconds)
+            moved = near_end = False
+            for st, info in zip(list(pending), infos):
+                if isinstance(info, exceptions.NodeConnectionError):
+                    st.conn_errors += 1
+                    log.warning(
+                        "NodeODM connection error while polling task %s (%s). Retry %d/%d in %ds...",
+                        st.uuid, info, st.conn_errors, max_connection_errors, poll_seconds
+                    )
+                    if st.conn_errors >= max_connection_errors:
+                        raise RuntimeError(
+                            f"Lost connection to NodeODM while polling task {st.uuid}. "
+                            f"NodeODM may have crashed or storage may be misconfigured."
+                        ) from info
+                    # Retry at the base interval
+                    moved = True
+                    continue
+                if isinstance(info, exceptions.NodeResponseError):
+                    # This is the “<uuid> not found” case.
+                    raise RuntimeError(
+                        f"NodeODM says task {st.uuid} was not found. "
+                        f"This almost always means the task was not persisted (storage/volume problem) "
+                        f"or NodeODM was restarted without persistent /var/www/data.\n"
+                        f"Original error: {info}"
+                    ) from info
+                if isinstance(info, BaseException):
+                    raise info
+                st.conn_errors = 0
+
+                status_raw = _safe(info, "status")
+                status = _status_to_str(status_raw)
+                progress = int(_safe(info, "progress", 0) or 0)
+                last_error = _safe(info, "last_error", None)
+
+                if progress != st.last_progress:
+                    # update() (unlike refresh()) honours mininterval
+                    st.pbar.update(max(0, min(100, progress)) - st.pbar.n)
+                    st.last_progress = progress
+                    moved = True
+                if progress >= 95:
+                    near_end = True
+
+                if status in ("COMPLETED", "FAILED", "CANCELED"):
+                    if status != "COMPLETED":
+                        raise RuntimeError(
+                            f"ODM task {st.uuid} ended with status={status}. last_error={last_error}. info={info}"
+                        )
+                    st.pbar.n = 100
+                    st.pbar.refresh()
+                    st.pbar.close()
+                    pending.remove(st)
+                    log.info("ODM task completed%s.", f": {st.uuid}" if len(tasks) > 1 else "")
+
+            if not pending:
+                return
+
+            if moved or near_end:
+                interval = float(poll_seconds)
+            else:
+                # Back off while nothing changes (long ODM stages)
+                interval = min(interval * 1.5, max(max_poll_seconds, poll_seconds))
+            await asyncio.sleep(interval)
+    finally:
+        for st in all_states:
+            st.pbar.close()
 
 
 def download_assets(task, out_dir: Path) -> None:
@@ -254,7 +420,9 @@ def download_assets(task, out_dir: Path) -> None:
     Download NodeODM output assets to a local directory.
 
     This uses pyodm's built-in download_assets method, which downloads
-    all available outputs generated by the ODM pipeline.
+    all available outputs generated by the ODM pipeline. pyodm already
+    streams all.zip to disk with parallel Range requests and per-chunk
+    retries before extracting it.
 
     Args:
         task:
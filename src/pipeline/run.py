@@ -1,27 +1,54 @@
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import hashlib
+import json
 import logging
+import multiprocessing
+import os
+import shutil
+import subprocess
+import threading
 import time
+import types
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from pyodm import Node
 
 from src.common.config import AppConfig
-from src.common.paths import build_run_paths
+from src.common.paths import RunPaths, build_run_paths
 from src.pipeline.frames import FrameExtractParams, extract_frames
 from src.pipeline.odm_client import connect, get_odm_hosts, pick_best_odm_host
-from src.pipeline.odm_task import ODMTaskParams, submit_task, wait_for_completion, download_assets
-from src.utils.hashing import sha1_file
+from src.pipeline.odm_task import ODMTaskParams, submit_task, wait_for_many, download_assets
+from src.utils.hashing import HashCache, fingerprint_file, full_hash_file
 
 log = logging.getLogger(__name__)
 
+# Cores one batch video's ffmpeg extraction keeps busy; sizes run_pipeline_many()'s pool
+_BATCH_CPUS_PER_WORKER = 4
+
 
-def _make_run_id(video_path: Path) -> str:
+def _make_run_id(
+    video_path: Path, full_hash: bool = False, cache: Optional[HashCache] = None, from_metadata: bool = False
+) -> str:
     """
     Generate a unique run identifier for the pipeline execution.
 
     The run ID is based on:
       - Current timestamp (YYYYMMDD_HHMMSS)
-      - A short SHA1 hash prefix of the input video file
+      - A short hash prefix of the input video file
+
+    By default the hash is a sampled fingerprint (head + tail + size, see
+    `fingerprint_file()`), so the whole video is not read up front.
+    With `full_hash=True` the whole file is hashed instead (BLAKE3 when
+    installed, SHA1 otherwise; see `full_hash_file()`), and the digest
+    is memoized in `cache` by (path, size, mtime) when one is given.
+    With `from_metadata=True` the hash is taken over the container
+    metadata reported by ffprobe (see `_metadata_id()`), with the
+    above as fallback when ffprobe or the metadata is unavailable.
 
     This makes the run ID:
       - mostly unique across executions
@@ -31,6 +58,15 @@ def _make_run_id(video_path: Path) -> str:
         video_path (Path):
             Path to the input video file.
 
+        full_hash (bool):
+            If True, hash the entire file content.
+
+        cache (Optional[HashCache]):
+            Digest cache used for the full-file hash.
+
+        from_metadata (bool):
+            If True, prefer an ffprobe-metadata id over hashing file bytes.
+
     Returns:
         str:
             Run identifier string in the format:
@@ -38,31 +74,73 @@ def _make_run_id(video_path: Path) -> str:
     """
     # stable-ish id: timestamp + hash prefix
     ts = time.strftime("%Y%m%d_%H%M%S")
-    h = sha1_file(video_path)[:10]
+    h = _metadata_id(video_path) if from_metadata else None
+    if h is None:
+        if not full_hash:
+            h = fingerprint_file(video_path)
+        elif cache is not None:
+            h = cache.digest(video_path, "full", full_hash_file)
+        else:
+            h = full_hash_file(video_path)
+    h = h[:10]
     return f"run_{ts}_{h}"
 
 
-def _merge_odm_options(base: Dict[str, Any], extra: Dict[str, Any]) -> Dict[str, Any]:
+def _metadata_id(video_path: Path) -> Optional[str]:
+    """
+    Derive a video identifier from container metadata via ffprobe.
+
+    Size, duration, bit rate and the `creation_time` tag are read
+    without touching the video stream, then hashed (SHA1 of the
+    canonical JSON).
+
+    Args:
+        video_path (Path):
+            Path to the input video file.
+
+    Returns:
+        Optional[str]:
+            Hex digest, or None if ffprobe is missing, fails, times out,
+            or reports no format section.
+    """
+    cmd = [
+        "ffprobe", "-v", "error",
+        "-show_entries", "format=size,duration,bit_rate:format_tags=creation_time",
+        "-of", "json", str(video_path),
+    ]
+    try:
+        p = subprocess.run(cmd, capture_output=True, timeout=5)
+        fmt = json.loads(p.stdout).get("format") if p.returncode == 0 else None
+    except (OSError, subprocess.SubprocessError, ValueError, AttributeError):
+        return None
+    if not isinstance(fmt, dict) or not fmt.get("size"):
+        return None
+    return hashlib.sha1(json.dumps(fmt, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _merge_odm_options(base: Mapping[str, Any], extra: Optional[Dict[str, Any]]) -> Mapping[str, Any]:
     """
     Merge ODM option dictionaries.
 
-    The function creates a shallow copy of the base dictionary and then
-    applies overrides from the extra dictionary.
+    Without extras, the (read-only) base mapping is returned as-is, so
+    the common no-override run makes no copy. Otherwise a new read-only
+    mapping is built where values in `extra` override values in `base`.
 
     Args:
-        base (Dict[str, Any]):
-            Base ODM options (typically from config YAML).
+        base (Mapping[str, Any]):
+            Base ODM options (typically `cfg.odm_options`, already read-only).
 
-        extra (Dict[str, Any]):
+        extra (Optional[Dict[str, Any]]):
             Extra ODM options (typically from CLI overrides).
 
     Returns:
-        Dict[str, Any]:
-            Merged dictionary where values in `extra` override values in `base`.
+        Mapping[str, Any]:
+            Merged read-only mapping where values in `extra` override values in `base`.
+            Use `dict(...)` at call sites that need to mutate it.
     """
-    merged = dict(base)
-    merged.update(extra or {})
-    return merged
+    if not extra:
+        return base
+    return types.MappingProxyType({**base, **extra})
 
 
 def _copy_summary_outputs(odm_out_dir: Path, processed_dir: Path) -> None:
@@ -97,8 +175,6 @@ def _copy_summary_outputs(odm_out_dir: Path, processed_dir: Path) -> None:
     We avoid being too opinionated: just copy entire directory if you want,
     but here we copy key targets when they exist.
     """
-    processed_dir.mkdir(parents=True, exist_ok=True)
-
     candidates = [
         # Common ODM outputs (may vary by options)
         odm_out_dir / "odm_orthophoto" / "odm_orthophoto.tif",
@@ -111,11 +187,276 @@ def _copy_summary_outputs(odm_out_dir: Path, processed_dir: Path) -> None:
         odm_out_dir / "odm_report" / "report.pdf",
     ]
 
+    present = _existing_files(candidates)
+    if not present:
+        return
+    # Created here, not by build_run_paths(), so runs without copying leave no empty tree
+    processed_dir.mkdir(parents=True, exist_ok=True)
+
+    # Same mount: hardlink instead of copying (no bytes moved)
+    same_fs = odm_out_dir.stat().st_dev == processed_dir.stat().st_dev
+
+    def _one(p: Path) -> None:
+        dst = processed_dir / p.name
+        if not _needs_copy(p, dst):
+            # Idempotent re-runs: already linked/copied and unchanged
+            log.info("Up to date %s -> %s", p, dst)
+            return
+        mode = _link_or_copy(p, dst, same_fs)
+        log.info("%s %s -> %s", mode, p, dst)
+
+    # Artifacts are independent; copy them in parallel (copyfile releases the GIL)
+    with ThreadPoolExecutor(max_workers=min(4, len(present))) as ex:
+        # list() re-raises the first copy error, if any
+        list(ex.map(_one, present))
+
+
+def _existing_files(candidates: List[Path]) -> List[Path]:
+    """
+    Return the candidates that exist, using one scandir per parent directory.
+
+    Listing each ODM output subfolder once replaces a stat() per
+    candidate; missing folders are skipped.
+
+    Args:
+        candidates (List[Path]):
+            File paths to check.
+
+    Returns:
+        List[Path]:
+            Existing candidates, in their original order.
+    """
+    wanted: Dict[Path, List[Path]] = {}
     for p in candidates:
-        if p.exists():
-            dst = processed_dir / p.name
-            dst.write_bytes(p.read_bytes())
-            log.info("Copied %s -> %s", p, dst)
+        wanted.setdefault(p.parent, []).append(p)
+
+    found = set()
+    for parent, files in wanted.items():
+        try:
+            with os.scandir(parent) as it:
+                names = {e.name for e in it}
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        found.update(p for p in files if p.name in names)
+
+    return [p for p in candidates if p in found]
+
+
+def _needs_copy(src: Path, dst: Path) -> bool:
+    """
+    Return True unless `dst` already matches `src` by size and mtime.
+
+    A destination that is missing, differs in size, or is older than the
+    source needs to be (re)written. Hardlinks share the source's inode,
+    so they always count as up to date.
+
+    Args:
+        src (Path):
+            Source file.
+
+        dst (Path):
+            Destination file.
+
+    Returns:
+        bool:
+            True if `dst` must be written.
+    """
+    try:
+        ss, ds = src.stat(), dst.stat()
+    except FileNotFoundError:
+        return True
+    return ss.st_size != ds.st_size or ss.st_mtime_ns > ds.st_mtime_ns
+
+
+def _link_or_copy(src: Path, dst: Path, try_link: bool) -> str:
+    """
+    Hardlink `src` to `dst` when possible, otherwise copy it.
+
+    An existing `dst` is replaced. Linking falls back to a copy on any
+    OSError (e.g. cross-device, or a filesystem without hardlinks).
+
+    Args:
+        src (Path):
+            Source file.
+
+        dst (Path):
+            Destination file path.
+
+        try_link (bool):
+            Whether to attempt a hardlink first (src and dst on one filesystem).
+
+    Returns:
+        str:
+            "Linked" or "Copied", for logging.
+    """
+    if try_link:
+        try:
+            try:
+                os.link(src, dst)
+            except FileExistsError:
+                dst.unlink()
+                os.link(src, dst)
+            return "Linked"
+        except OSError:
+            pass
+    # Streams in-kernel where supported instead of via a bytes object
+    shutil.copyfile(src, dst)
+    return "Copied"
+
+
+def _pick_and_connect(hosts: List[str], preferred_host: Optional[str] = None) -> Tuple[str, Node]:
+    """
+    Pick the least-loaded NodeODM host and connect to it.
+
+    Args:
+        hosts (List[str]):
+            Candidate NodeODM hosts.
+
+        preferred_host (Optional[str]):
+            Host to try first without probing the others (e.g. a batch
+            assignment). If it cannot be reached, the best of the
+            remaining `hosts` is picked instead.
+
+    Returns:
+        Tuple[str, Node]:
+            (selected host, connected pyodm Node)
+    """
+    if preferred_host is not None:
+        try:
+            return preferred_host, connect(preferred_host)
+        except RuntimeError as e:
+            others = [h for h in hosts if h != preferred_host]
+            if not others:
+                raise
+            log.warning("Preferred NodeODM host %s is unreachable (%s); picking another", preferred_host, e)
+            hosts = others
+    host = pick_best_odm_host(hosts)
+    return host, connect(host)
+
+
+def _prepare_run(
+    cfg: AppConfig,
+    video_path: Path,
+    run_id: Optional[str],
+    fparams: FrameExtractParams,
+    abort: Optional[threading.Event] = None,
+) -> RunPaths:
+    """
+    Generate the run id (if needed), create the run layout, and extract frames.
+
+    Args:
+        cfg (AppConfig):
+            Parsed application configuration.
+
+        video_path (Path):
+            Input video file.
+
+        run_id (Optional[str]):
+            Custom run identifier. If None, one is generated from the video.
+
+        fparams (FrameExtractParams):
+            Frame extraction parameters.
+
+        abort (Optional[threading.Event]):
+            Checked between stages; once set, the remaining stages are
+            skipped (a running ffmpeg call is not interrupted).
+
+    Returns:
+        RunPaths:
+            Filesystem layout of the run, with frames extracted.
+
+    Raises:
+        RuntimeError:
+            If `abort` was set before extraction started.
+    """
+    if not run_id:
+        cache = HashCache(cfg.runtime.data_dir / ".hash_cache.json")
+        run_id = _make_run_id(
+            video_path,
+            full_hash=cfg.runtime.run_id_full_hash,
+            cache=cache,
+            from_metadata=cfg.runtime.run_id_from_metadata,
+        )
+    if abort is not None and abort.is_set():
+        raise RuntimeError("Run preparation aborted")
+    paths = build_run_paths(cfg.runtime.runs_dir, cfg.runtime.data_dir, run_id, create=True)
+
+    log.info("Run id: %s", run_id)
+    log.info("Run dir: %s", paths.run_dir)
+
+    if abort is not None and abort.is_set():
+        raise RuntimeError("Run preparation aborted")
+    extract_frames(video_path=video_path, out_dir=paths.frames_dir, params=fparams)
+    return paths
+
+
+async def _prepare_and_connect(
+    cfg: AppConfig,
+    video_path: Path,
+    run_id: Optional[str],
+    fparams: FrameExtractParams,
+    hosts: List[str],
+    preferred_host: Optional[str] = None,
+) -> Tuple[RunPaths, str, Node]:
+    """
+    Prepare the run and select/connect a NodeODM host concurrently.
+
+    Hashing the video, creating directories, and extracting frames
+    (`_prepare_run()`) are independent of host probing, which is
+    network-bound, so each side runs in its own worker thread and the
+    wall time is the slower of the two instead of their sum.
+
+    The first failure is raised as soon as it happens: if no NodeODM is
+    reachable, the error surfaces right after probing instead of after
+    the whole extraction. The other side is then abandoned, not
+    cancelled, since threads cannot be interrupted: preparation skips
+    its remaining stages, but an ffmpeg call already in flight runs to
+    completion in the background (and the process only exits once it
+    returns).
+
+    Args:
+        cfg (AppConfig):
+            Parsed application configuration.
+
+        video_path (Path):
+            Input video file.
+
+        run_id (Optional[str]):
+            Custom run identifier, or None to generate one.
+
+        fparams (FrameExtractParams):
+            Frame extraction parameters.
+
+        hosts (List[str]):
+            Candidate NodeODM hosts.
+
+        preferred_host (Optional[str]):
+            Host to try first (see `_pick_and_connect()`).
+
+    Returns:
+        Tuple[RunPaths, str, Node]:
+            (run paths, selected host, connected pyodm Node)
+
+    Raises:
+        RuntimeError:
+            If extraction fails or NodeODM is unreachable.
+    """
+    abort = threading.Event()
+    loop = asyncio.get_running_loop()
+    # Own executor: asyncio.run() would otherwise join an abandoned thread on exit
+    ex = ThreadPoolExecutor(max_workers=2, thread_name_prefix="prepare")
+    try:
+        pick = loop.run_in_executor(ex, _pick_and_connect, hosts, preferred_host)
+        prepare = loop.run_in_executor(ex, _prepare_run, cfg, video_path, run_id, fparams, abort)
+        await asyncio.wait((pick, prepare), return_when=asyncio.FIRST_EXCEPTION)
+        for fut in (pick, prepare):
+            if fut.done() and fut.exception() is not None:
+                abort.set()
+                raise fut.exception()
+        host, node = pick.result()
+        return prepare.result(), host, node
+    finally:
+        ex.shutdown(wait=False)
 
 
 def run_pipeline(
@@ -128,7 +469,10 @@ def run_pipeline(
     duration_seconds: Optional[float] = None,
     odm_extra_options: Optional[Dict[str, Any]] = None,
     copy_processed: bool = True,
-) -> None:
+    shard_hosts: bool = False,
+    segments: Optional[List[Tuple[float, float]]] = None,
+    preferred_host: Optional[str] = None,
+) -> RunPaths:
     """
     Run the full end-to-end photogrammetry pipeline using NodeODM.
 
@@ -137,7 +481,7 @@ def run_pipeline(
         2. Generate run_id (if not provided)
         3. Build run directory structure
         4. Extract frames from the input video using ffmpeg
-        5. Connect to NodeODM (supports multiple hosts)
+        5. Connect to NodeODM (supports multiple hosts), concurrently with 2-4
         6. Submit ODM task with extracted images
         7. Poll until completion
         8. Download all resulting assets
@@ -177,8 +521,23 @@ def run_pipeline(
         copy_processed (bool):
             If True, copy selected key output artifacts into processed_dir.
 
+        shard_hosts (bool):
+            If True and several NodeODM hosts are configured, split the
+            images across all of them as independent tasks (see
+            `submit_task()`). Outputs land in `shard_<n>/` subfolders.
+
+        segments (Optional[List[Tuple[float, float]]]):
+            Optional (start, duration) ranges extracted in one ffmpeg pass.
+            Overrides start/duration when given.
+
+        preferred_host (Optional[str]):
+            NodeODM host to use if it is reachable, skipping the load
+            probe (used by `run_pipeline_many()` to spread videos across
+            hosts). Falls back to the least-loaded configured host.
+
     Returns:
-        None
+        RunPaths:
+            Filesystem layout of the completed run.
 
     Raises:
         FileNotFoundError:
@@ -190,18 +549,6 @@ def run_pipeline(
     if not video_path.exists():
         raise FileNotFoundError(f"Video not found: {video_path}")
 
-    run_id = run_id or _make_run_id(video_path)
-    paths = build_run_paths(cfg.runtime.runs_dir, cfg.runtime.data_dir, run_id)
-
-    # Create directories
-    paths.run_dir.mkdir(parents=True, exist_ok=True)
-    paths.logs_dir.mkdir(parents=True, exist_ok=True)
-    paths.frames_dir.mkdir(parents=True, exist_ok=True)
-    paths.odm_out_dir.mkdir(parents=True, exist_ok=True)
-
-    log.info("Run id: %s", run_id)
-    log.info("Run dir: %s", paths.run_dir)
-
     # 1) Extract frames
     vcfg = cfg.video
     fparams = FrameExtractParams(
@@ -209,29 +556,161 @@ def run_pipeline(
         max_frames=int(max_frames if max_frames is not None else vcfg.max_frames),
         start_seconds=float(start_seconds if start_seconds is not None else vcfg.start_seconds),
         duration_seconds=float(duration_seconds if duration_seconds is not None else vcfg.duration_seconds),
+        segments=tuple((float(a), float(b)) for a, b in segments or ()),
     )
-    extract_frames(video_path=video_path, out_dir=paths.frames_dir, params=fparams)
 
-    # 2) Connect to NodeODM
+    # 2) Connect to NodeODM (probed while the video is hashed and frames are extracted)
     hosts = get_odm_hosts(cfg.odm.host_env, cfg.odm.host_default)
-    host = pick_best_odm_host(hosts)
-    node = connect(host)
+    paths, host, node = asyncio.run(_prepare_and_connect(cfg, video_path, run_id, fparams, hosts, preferred_host))
 
     # 3) Submit task
-    odm_opts = _merge_odm_options(cfg.odm_options, odm_extra_options or {})
+    odm_opts = _merge_odm_options(cfg.odm_options, odm_extra_options)
     tparams = ODMTaskParams(options=odm_opts, parallel_uploads=cfg.odm.parallel_uploads, poll_seconds=cfg.odm.poll_seconds)
 
-    task = submit_task(node=node, images_dir=paths.frames_dir, params=tparams)
+    others = [h for h in hosts if h != host] if shard_hosts else []
+    if others:
+        tasks = submit_task(node=node, images_dir=paths.frames_dir, params=tparams, shard_hosts=others)
+        out_dirs = [paths.odm_out_dir / f"shard_{i + 1:02d}" for i in range(len(tasks))]
+    else:
+        tasks = [submit_task(node=node, images_dir=paths.frames_dir, params=tparams)]
+        out_dirs = [paths.odm_out_dir]
 
     # 4) Wait for completion
-    wait_for_completion(task=task, poll_seconds=cfg.odm.poll_seconds)
+    wait_for_many(tasks=tasks, poll_seconds=cfg.odm.poll_seconds)
 
     # 5) Download results
-    download_assets(task=task, out_dir=paths.odm_out_dir)
+    for task, out_dir in zip(tasks, out_dirs):
+        download_assets(task=task, out_dir=out_dir)
 
     # 6) Optionally copy summary outputs
     if copy_processed:
-        _copy_summary_outputs(paths.odm_out_dir, paths.processed_dir)
+        for out_dir in out_dirs:
+            _copy_summary_outputs(out_dir, paths.processed_dir / out_dir.relative_to(paths.odm_out_dir))
 
     log.info("Pipeline completed successfully.")
     log.info("Results: %s", paths.odm_out_dir)
+    return paths
+
+
+def run_pipeline_many(
+    cfg: AppConfig,
+    videos: List[Path],
+    num_workers: Optional[int] = None,
+    **kwargs: Any,
+) -> Path:
+    """
+    Run the pipeline for several videos in parallel worker processes.
+
+    Videos are mapped over a `spawn`-context ProcessPoolExecutor (fresh
+    interpreters: no inherited pyodm/HTTP/ffmpeg state), so one video's
+    frame extraction overlaps other videos' uploads and ODM processing.
+    Each worker runs `run_pipeline(cfg, video, **kwargs)` with logging
+    configured from `cfg.runtime.log_level`. The parent assigns the
+    videos to the NodeODM hosts round-robin and passes each one's host as
+    `preferred_host`, so concurrent workers don't all probe and pick the
+    same idle node; a worker whose host is unreachable falls back to the
+    least-loaded remaining host. With `shard_hosts` no host is preferred.
+
+    Results are merged into one JSON manifest under `cfg.runtime.data_dir`
+    listing, per video, its run id and output directories (or the error).
+
+    Args:
+        cfg (AppConfig):
+            Parsed application configuration.
+
+        videos (List[Path]):
+            Input video files.
+
+        num_workers (Optional[int]):
+            Maximum worker processes. Defaults to one per
+            `_BATCH_CPUS_PER_WORKER` CPUs (at least 2, so one video's
+            extraction overlaps another's ODM run), capped at the number
+            of videos.
+
+        **kwargs:
+            Extra `run_pipeline()` arguments applied to every video
+            (e.g. fps, max_frames, odm_extra_options). `run_id` is not
+            allowed, since every run needs its own.
+
+    Returns:
+        Path:
+            Path of the written manifest (data_dir/batch_<timestamp>.json).
+
+    Raises:
+        ValueError:
+            If `videos` is empty or `run_id` is passed.
+
+        RuntimeError:
+            If any run failed (after the manifest has been written).
+    """
+    if not videos:
+        raise ValueError("videos must be non-empty")
+    if kwargs.get("run_id"):
+        raise ValueError("run_id cannot be shared across a batch")
+
+    # MappingProxyType does not pickle; workers re-wrap a plain dict
+    picklable_cfg = dataclasses.replace(cfg, odm_options=dict(cfg.odm_options))
+    hosts = get_odm_hosts(cfg.odm.host_env, cfg.odm.host_default)
+    default_workers = max(2, (os.cpu_count() or 1) // _BATCH_CPUS_PER_WORKER)
+    workers = min(len(videos), num_workers or default_workers)
+    preferred = [None] * len(videos) if kwargs.get("shard_hosts") else [hosts[i % len(hosts)] for i in range(len(videos))]
+    ctx = multiprocessing.get_context("spawn")
+
+    from src.common.logging import setup_logging
+
+    entries: List[Dict[str, Any]] = []
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=ctx, initializer=setup_logging, initargs=(cfg.runtime.log_level,)
+    ) as ex:
+        futures = [ex.submit(_run_one, picklable_cfg, Path(v), host, kwargs) for v, host in zip(videos, preferred)]
+        for video, fut in zip(videos, futures):
+            entry: Dict[str, Any] = {"video": str(video)}
+            try:
+                paths = fut.result()
+            except Exception as e:
+                log.error("Run for %s failed: %s", video, e)
+                entry.update(status="failed", error=f"{type(e).__name__}: {e}")
+            else:
+                entry.update(
+                    status="completed",
+                    run_id=paths.run_dir.name,
+                    run_dir=str(paths.run_dir),
+                    odm_out_dir=str(paths.odm_out_dir),
+                    processed_dir=str(paths.processed_dir),
+                )
+            entries.append(entry)
+
+    manifest = cfg.runtime.data_dir / f"batch_{time.strftime('%Y%m%d_%H%M%S')}.json"
+    manifest.parent.mkdir(parents=True, exist_ok=True)
+    manifest.write_text(json.dumps({"runs": entries}, indent=2), encoding="utf-8")
+    log.info("Batch manifest: %s", manifest)
+
+    failed = [e["video"] for e in entries if e["status"] != "completed"]
+    if failed:
+        raise RuntimeError(f"{len(failed)}/{len(entries)} runs failed: {', '.join(failed)} (see {manifest})")
+    return manifest
+
+
+def _run_one(cfg: AppConfig, video_path: Path, host: Optional[str], kwargs: Dict[str, Any]) -> RunPaths:
+    """
+    Worker entry point for `run_pipeline_many()`.
+
+    Args:
+        cfg (AppConfig):
+            Configuration with `odm_options` as a plain dict (picklable).
+
+        video_path (Path):
+            Input video file.
+
+        host (Optional[str]):
+            NodeODM host assigned by the parent (`preferred_host`), or None.
+
+        kwargs (Dict[str, Any]):
+            Extra `run_pipeline()` arguments.
+
+    Returns:
+        RunPaths:
+            Filesystem layout of the completed run.
+    """
+    cfg = dataclasses.replace(cfg, odm_options=types.MappingProxyType(cfg.odm_options))
+    return run_pipeline(cfg, video_path, preferred_host=host, **kwargs)
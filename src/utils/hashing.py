@@ -1,15 +1,33 @@
 from __future__ import annotations
 
 import hashlib
+import json
+import mmap
+import os
+import struct
 from pathlib import Path
+from typing import Callable, Dict, Optional
 
+try:
+    import blake3
+except ImportError:  # optional: full_hash_file() falls back to SHA1
+    blake3 = None
 
-def sha1_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
+# Files at least this large are hashed through a read-only mmap
+_MMAP_MIN_SIZE = 10 * 1024 * 1024
+
+
+def sha1_file(path: Path, chunk_size: int = 8 * 1024 * 1024) -> str:
     """
     Compute the SHA1 hash of a file.
 
-    This function reads the file in chunks (default: 1MB) to avoid
-    loading large files entirely into memory. It is useful for:
+    Files of 10MB or more are mapped read-only with mmap and fed to the
+    hasher in one call (no per-chunk Python allocations); smaller files,
+    or files mmap refuses (e.g. some network filesystems), are streamed
+    with `hashlib.file_digest()` on Python 3.11+, or read in chunks
+    (default: 8MB) on older runtimes. The hasher is created with
+    `usedforsecurity=False`, so OpenSSL may use its fastest (e.g. SHA-NI)
+    implementation even on FIPS-restricted builds. It is useful for:
       - generating stable run identifiers
       - verifying file integrity
       - caching and deduplication logic
@@ -19,8 +37,8 @@ def sha1_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
             Path to the file whose SHA1 hash should be computed.
 
         chunk_size (int):
-            Number of bytes to read per iteration.
-            Default is 1MB (1024 * 1024).
+            Number of bytes to read per iteration in the pre-3.11 loop.
+            Default is 8MB (8 * 1024 * 1024).
 
     Returns:
         str:
@@ -28,11 +46,187 @@ def sha1_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
             Example:
                 "2fd4e1c67a2d28fced849ee1bb76e7391b93eb12"
     """
-    h = hashlib.sha1()
-    with path.open("rb") as f:
+    h = hashlib.new("sha1", usedforsecurity=False)
+    # Unbuffered: mmap and file_digest() read the fd directly
+    with path.open("rb", buffering=0) as f:
+        if path.stat().st_size >= _MMAP_MIN_SIZE:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    _advise_sequential(mm)
+                    h.update(mm)
+                return h.hexdigest()
+            except (ValueError, OSError):
+                # Fall back to the streaming paths below
+                f.seek(0)
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: readinto() a reusable buffer, GIL released while hashing
+            return hashlib.file_digest(f, lambda: h).hexdigest()
+        # One reusable buffer: no per-chunk bytes allocation
+        buf = bytearray(chunk_size)
+        mv = memoryview(buf)
         while True:
-            b = f.read(chunk_size)
-            if not b:
+            n = f.readinto(buf)
+            if not n:
                 break
-            h.update(b)
+            h.update(mv[:n])
+    return h.hexdigest()
+
+
+def _advise_sequential(mm: mmap.mmap) -> None:
+    """
+    Hint the kernel that `mm` will be read once, front to back.
+
+    MADV_SEQUENTIAL enables aggressive read-ahead (and early page
+    reclaim), MADV_WILLNEED starts prefetching right away, so the hasher
+    doesn't stall on page faults. Unsupported hints are skipped
+    (e.g. on Windows, where mmap has no `madvise`).
+
+    Args:
+        mm (mmap.mmap):
+            Read-only mapping about to be hashed.
+
+    Returns:
+        None
+    """
+    if not hasattr(mm, "madvise"):
+        return
+    for name in ("MADV_SEQUENTIAL", "MADV_WILLNEED"):
+        advice = getattr(mmap, name, None)
+        if advice is None:
+            continue
+        try:
+            mm.madvise(advice)
+        except OSError:
+            # Advisory only
+            pass
+
+
+def fingerprint_file(path: Path, sample_size: int = 4 * 1024 * 1024) -> str:
+    """
+    Compute a fast, non-cryptographic fingerprint of a (large) file.
+
+    Only the first and last `sample_size` bytes are read, together with
+    the file size, and hashed with BLAKE2b (8-byte digest). This makes
+    the cost O(sample_size) instead of O(file size), which matters for
+    multi-gigabyte drone videos.
+
+    It is meant for identifiers (e.g. run ids), not integrity checks:
+    two files differing only in their middle section collide. Use
+    `sha1_file()` when the full content must be covered.
+
+    Args:
+        path (Path):
+            Path to the file to fingerprint.
+
+        sample_size (int):
+            Number of bytes read from each end of the file.
+            Default is 4MB (4 * 1024 * 1024), enough to cover container
+            headers/indexes at both ends of typical MP4/MOV files.
+
+    Returns:
+        str:
+            Fingerprint as a 16-character hexadecimal string.
+    """
+    h = hashlib.blake2b(digest_size=8)
+    size = path.stat().st_size
+    with path.open("rb") as f:
+        h.update(f.read(sample_size))
+        if size > sample_size:
+            # Tail sample; starts after the head so no byte is read twice
+            f.seek(max(sample_size, size - sample_size))
+            h.update(f.read(sample_size))
+    h.update(struct.pack("<Q", size))
     return h.hexdigest()
+
+
+def full_hash_file(path: Path) -> str:
+    """
+    Hash an entire file as fast as the environment allows.
+
+    Uses BLAKE3 (mmap-fed, SIMD, multi-threaded) when the `blake3`
+    package is installed, and falls back to `sha1_file()` otherwise.
+    The digest is only meant for identifiers such as run ids; callers
+    needing a specific algorithm should use `sha1_file()` directly.
+
+    Args:
+        path (Path):
+            Path to the file to hash.
+
+    Returns:
+        str:
+            Hexadecimal digest (BLAKE3 or SHA1).
+    """
+    if blake3 is None:
+        return sha1_file(path)
+    h = blake3.blake3(max_threads=blake3.blake3.AUTO)
+    h.update_mmap(str(path))
+    return h.hexdigest()
+
+
+class HashCache:
+    """
+    Small JSON-backed cache of file digests.
+
+    Entries are keyed by digest kind and absolute path, and are only
+    reused while the file's size and mtime (ns) are unchanged, so
+    repeated runs on the same video skip re-hashing it.
+
+    Attributes:
+        path (Path):
+            Location of the JSON cache file (e.g. data_dir/.hash_cache.json).
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._entries: Optional[Dict[str, list]] = None
+
+    def _load(self) -> Dict[str, list]:
+        if self._entries is None:
+            try:
+                entries = json.loads(self.path.read_bytes())
+            except (OSError, ValueError):
+                entries = None
+            self._entries = entries if isinstance(entries, dict) else {}
+        return self._entries
+
+    def _save(self) -> None:
+        # Atomic replace; unique temp name so concurrent runs don't clash.
+        # Failures are ignored: the cache is only an optimization.
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(self._load()), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+    def digest(self, path: Path, kind: str, compute: Callable[[Path], str]) -> str:
+        """
+        Return the cached digest of `path`, computing and storing it on a miss.
+
+        Args:
+            path (Path):
+                File to hash.
+
+            kind (str):
+                Digest kind (e.g. "full"), so different hash functions
+                never share entries.
+
+            compute (Callable[[Path], str]):
+                Hash function called on a cache miss.
+
+        Returns:
+            str:
+                Hexadecimal digest.
+        """
+        st = path.stat()
+        key = f"{kind}:{path.resolve()}"
+        entries = self._load()
+        hit = entries.get(key)
+        if isinstance(hit, list) and hit[:2] == [st.st_size, st.st_mtime_ns]:
+            return hit[2]
+
+        digest = compute(path)
+        entries[key] = [st.st_size, st.st_mtime_ns, digest]
+        self._save()
+        return digest
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import logging
+import os
+import shlex
 import subprocess
+import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import IO, List, Optional
 
 log = logging.getLogger(__name__)
 
@@ -12,11 +15,14 @@ def run_cmd(cmd: List[str], cwd: Optional[Path] = None) -> None:
     """
     Run an external system command and raise an error if it fails.
 
-    This is a small wrapper around `subprocess.run()` that:
+    This is a small wrapper around `subprocess.Popen()` that:
       - logs the command being executed
-      - captures stdout/stderr
+      - streams stdout (INFO) and stderr (WARNING) to the log line by line,
+        as the command produces them
       - raises RuntimeError if the command fails
-      - logs stdout/stderr output when available
+
+    Output is never buffered in full, so memory stays constant no matter
+    how much a long-running tool prints.
 
     It is mainly used for running external tools such as:
       - ffmpeg (frame extraction)
@@ -40,13 +46,58 @@ def run_cmd(cmd: List[str], cwd: Optional[Path] = None) -> None:
             If the command returns a non-zero exit code.
             The error includes the return code and command string.
     """
-    log.info("Running: %s", " ".join(cmd))
-    p = subprocess.run(cmd, cwd=str(cwd) if cwd else None, capture_output=True, text=True)
-    if p.returncode != 0:
-        log.error("STDOUT:\n%s", p.stdout)
-        log.error("STDERR:\n%s", p.stderr)
-        raise RuntimeError(f"Command failed with code {p.returncode}: {' '.join(cmd)}")
-    if p.stdout.strip():
-        log.info("STDOUT:\n%s", p.stdout.strip())
-    if p.stderr.strip():
-        log.warning("STDERR:\n%s", p.stderr.strip())
+    if log.isEnabledFor(logging.INFO):
+        # Shell-quoted so logged commands can be copy-pasted
+        log.info("Running: %s", shlex.join(cmd))
+    p = subprocess.Popen(
+        cmd,
+        cwd=os.fspath(cwd) if cwd else None,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+        bufsize=1,
+    )
+    readers = [
+        threading.Thread(target=_pump, args=(p.stdout, logging.INFO, "STDOUT"), daemon=True),
+        threading.Thread(target=_pump, args=(p.stderr, logging.WARNING, "STDERR"), daemon=True),
+    ]
+    for t in readers:
+        t.start()
+    try:
+        returncode = p.wait()
+    except BaseException:
+        # e.g. KeyboardInterrupt: don't leave the child running
+        p.kill()
+        p.wait()
+        raise
+    finally:
+        for t in readers:
+            t.join()
+
+    if returncode != 0:
+        raise RuntimeError(f"Command failed with code {returncode}: {shlex.join(cmd)}")
+
+
+def _pump(stream: IO[str], level: int, label: str) -> None:
+    """
+    Forward a child process stream to the log, one line at a time.
+
+    Args:
+        stream (IO[str]):
+            Text stream (the child's stdout or stderr pipe).
+
+        level (int):
+            Logging level for each line.
+
+        label (str):
+            Prefix identifying the stream ("STDOUT" / "STDERR").
+
+    Returns:
+        None
+    """
+    with stream:
+        for line in stream:
+            line = line.rstrip()
+            if line:
+                log.log(level, "%s: %s", label, line)
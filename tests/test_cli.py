@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import argparse
+import math
+
+import pytest
+
+from src.cli import parse_kv_list, parse_segment
+
+
+def _old_coerce(v: str):
+    """The original try-int-then-float coercion of parse_kv_list()."""
+    vl = v.strip().lower()
+    if vl in ("true", "false"):
+        return vl == "true"
+    try:
+        return int(v)
+    except ValueError:
+        try:
+            return float(v)
+        except ValueError:
+            return v
+
+
+VALUES = [
+    "true", "False", "200000", "-3", "+7", " 12 ", "007", "1_000", "1__000", "_1", "1_",
+    "2.5", ".5", "5.", "-1e-3", "1E5", "1.e5", "1_0.5", "1e1_0", "1e", "e5", ".",
+    "inf", "-inf", "+Infinity", "nan", "NaN", "-nan", "infinite", "0x10", "1,5",
+    "high", "", "a=b", "١٢",
+]
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_kv_coercion_matches_int_float_fallthrough(value):
+    got = parse_kv_list([f"k={value}"])["k"]
+    want = _old_coerce(value)
+    assert type(got) is type(want)
+    if isinstance(want, float) and math.isnan(want):
+        assert math.isnan(got)
+    else:
+        assert got == want
+
+
+def test_kv_special_values():
+    out = parse_kv_list(["a=1_000", "b=inf", "c=nan", "d=-Infinity"])
+    assert out["a"] == 1000 and isinstance(out["a"], int)
+    assert out["b"] == math.inf
+    assert math.isnan(out["c"])
+    assert out["d"] == -math.inf
+
+
+@pytest.mark.parametrize("text", ["inf:10", "0:nan", "-1:5", "5", "a:b"])
+def test_segment_rejects_invalid(text):
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_segment(text)
+
+
+def test_segment_parses():
+    assert parse_segment("12.5:30") == (12.5, 30.0)
+    assert parse_segment("1_0:0") == (10.0, 0.0)
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import time
+
+import httpx
+import pytest
+
+from src.pipeline import odm_client
+
+A = "http://node-a:3000"
+B = "http://node-b:3000"
+
+
+@pytest.fixture(autouse=True)
+def clear_load_cache():
+    odm_client._LOAD_CACHE.clear()
+    yield
+    odm_client._LOAD_CACHE.clear()
+
+
+@pytest.fixture
+def fake_nodes(monkeypatch):
+    """
+    Replace the /info probe with an in-memory table of host loads.
+
+    Hosts mapped to None are down (the probe raises a connection error).
+    """
+    loads: dict[str, tuple[int, int, int] | None] = {}
+
+    async def fake_node_info(client, base_url, timeout_s=2.0):
+        load = loads[base_url]
+        if load is None:
+            raise httpx.ConnectError(f"{base_url} is down")
+        return load
+
+    monkeypatch.setattr(odm_client, "_node_info", fake_node_info)
+    monkeypatch.setenv("ODM_LOAD_CACHE_TTL", "0.2")
+    return loads
+
+
+def test_fresh_host_beats_stale_cached_host(fake_nodes):
+    fake_nodes.update({A: (0, 0, 0), B: (1, 0, 1)})
+    assert odm_client.pick_best_odm_host([A, B]) == A
+
+    # A dies after being cached; once the TTL expires its probe fails
+    fake_nodes[A] = None
+    time.sleep(0.3)
+    assert odm_client.pick_best_odm_host([B, A]) == B
+    assert odm_client.pick_best_odm_host([A, B]) == B
+
+
+def test_stale_load_is_evicted_after_cap(fake_nodes):
+    fake_nodes.update({A: (0, 0, 0), B: None})
+    assert odm_client.pick_best_odm_host([A, B]) == A
+
+    fake_nodes[A] = None
+    time.sleep(0.2 * odm_client._LOAD_CACHE_STALE_FACTOR + 0.1)
+    # Nothing answers: fall back to the first host, and forget A's old load
+    assert odm_client.pick_best_odm_host([B, A]) == B
+    assert A not in odm_client._LOAD_CACHE
+
+
+def test_stale_idle_host_does_not_end_probing_early(fake_nodes):
+    fake_nodes.update({A: (0, 0, 0), B: (2, 1, 3)})
+    assert odm_client.pick_best_odm_host([A, B]) == A
+
+    fake_nodes[A] = None
+    time.sleep(0.3)
+    results = odm_client.asyncio.run(odm_client._probe_hosts([A, B], 2.0, 30.0))
+    assert sorted(results) == [(False, 2, 1, 3, 1), (True, 0, 0, 0, 0)]
+
+
+def _task(code: int) -> dict:
+    return {"status": {"code": code}}
+
+
+@pytest.fixture
+def http_nodes(monkeypatch):
+    """
+    Serve fake NodeODM HTTP APIs through httpx.MockTransport.
+
+    Each host maps to either an /info payload with queue stats, or a
+    list of task infos (an older node without taskQueueCount, so the
+    /task/list fallback is used).
+    """
+    nodes: dict[str, dict | list] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        node = nodes[f"{request.url.scheme}://{request.url.host}:{request.url.port}"]
+        path = request.url.path
+        if path == "/info":
+            return httpx.Response(200, json=node if isinstance(node, dict) else {"version": "1.0"})
+        if path == "/task/list":
+            return httpx.Response(200, json=[{"uuid": str(i)} for i in range(len(node))])
+        uid = path.split("/")[2]
+        return httpx.Response(200, json=node[int(uid)])
+
+    monkeypatch.setattr(odm_client.httpx, "AsyncHTTPTransport", lambda **kw: httpx.MockTransport(handler))
+    return nodes
+
+
+def test_info_and_task_scan_loads_have_the_same_meaning(http_nodes):
+    # One running task each; B also still lists five finished tasks
+    http_nodes[A] = {"taskQueueCount": 1, "maxParallelTasks": 2}
+    http_nodes[B] = [_task(20)] + [_task(40)] * 5
+
+    results = odm_client.asyncio.run(odm_client._probe_hosts([A, B], 2.0, 30.0))
+    assert sorted(results) == [(False, 1, 0, 1, 0), (False, 1, 0, 1, 1)]
+
+
+def test_mixed_probe_paths_rank_on_one_scale(http_nodes):
+    http_nodes[A] = {"taskQueueCount": 2, "maxParallelTasks": 1}  # 1 running + 1 queued
+    http_nodes[B] = [_task(20)] + [_task(40)] * 10  # 1 running, plus finished history
+    assert odm_client.pick_best_odm_host([A, B]) == B
+
+    odm_client._LOAD_CACHE.clear()
+    # Equal real load: B's finished tasks must not count against it
+    http_nodes[A] = {"taskQueueCount": 1, "maxParallelTasks": 2}
+    http_nodes[B] = [_task(20)] + [_task(40)] * 5
+    assert odm_client.pick_best_odm_host([B, A]) == B
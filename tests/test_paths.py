@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from src.common.paths import build_run_paths
+
+
+def test_create_skips_processed_dir(tmp_path):
+    paths = build_run_paths(tmp_path / "runs", tmp_path / "data", "run_x", create=True)
+
+    for d in (paths.run_dir, paths.logs_dir, paths.frames_dir, paths.odm_out_dir):
+        assert d.is_dir()
+    # Only created when summary outputs are copied (not with --no-copy-processed)
+    assert not paths.processed_dir.exists()
+    assert not (tmp_path / "data" / "processed").exists()
+
+
+def test_no_create_touches_nothing(tmp_path):
+    build_run_paths(tmp_path / "runs", tmp_path / "data", "run_x")
+    assert list(tmp_path.iterdir()) == []
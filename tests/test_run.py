@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from src.pipeline.run import _copy_summary_outputs
+
+
+def test_copy_summary_outputs_without_artifacts_creates_nothing(tmp_path):
+    odm_out = tmp_path / "odm"
+    odm_out.mkdir()
+    processed = tmp_path / "processed" / "run_x"
+
+    _copy_summary_outputs(odm_out, processed)
+    assert not processed.exists()
+
+
+def test_copy_summary_outputs_creates_processed_dir(tmp_path):
+    odm_out = tmp_path / "odm"
+    (odm_out / "odm_report").mkdir(parents=True)
+    (odm_out / "odm_report" / "report.pdf").write_bytes(b"%PDF")
+    processed = tmp_path / "processed" / "run_x"
+
+    _copy_summary_outputs(odm_out, processed)
+    assert (processed / "report.pdf").read_bytes() == b"%PDF"